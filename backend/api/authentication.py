@@ -0,0 +1,50 @@
+"""
+JWT Authentication
+Caches validated access tokens so repeat requests skip signature verification.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication with a small in-process LRU of validated tokens.
+    Entries are keyed by the SHA-256 of the raw token and live for at most
+    CACHE_TTL seconds (never past the token's own expiry).
+    """
+    CACHE_TTL = 10
+    CACHE_MAXSIZE = 10_000
+
+    _cache = OrderedDict()
+    _lock = threading.Lock()
+
+    def get_validated_token(self, raw_token):
+        """Return a cached validated token, or validate and cache it."""
+        key = hashlib.sha256(raw_token).digest()
+        now = time.time()
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                validated_token, expires_at = entry
+                if expires_at > now:
+                    self._cache.move_to_end(key)
+                    return validated_token
+                del self._cache[key]
+
+        # Raises InvalidToken on failure, so bad tokens are never cached
+        validated_token = super().get_validated_token(raw_token)
+
+        ttl = min(validated_token.get("exp", now) - now, self.CACHE_TTL)
+        if ttl > 0:
+            with self._lock:
+                self._cache[key] = (validated_token, now + ttl)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.CACHE_MAXSIZE:
+                    self._cache.popitem(last=False)
+
+        return validated_token
@@ -1,3 +1,141 @@
-from django.test import TestCase
+"""
+API Tests
+CORS origins, JWT auth caching, ETag revalidation and the combined upload.
+"""
+import shutil
+import tempfile
+from pathlib import Path
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .authentication import CachedJWTAuthentication
+
+SAMPLE_CSV = (
+    b"Equipment Name,Type,Flowrate,Pressure,Temperature\n"
+    b"Pump-1,Pump,120.0,5.0,110.0\n"
+    b"Valve-1,Valve,60.0,4.0,100.0\n"
+)
+
+
+class APITestBase(APITestCase):
+    """Authenticated client with uploads written to a throwaway directory."""
+
+    def setUp(self):
+        upload_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, upload_root, ignore_errors=True)
+        settings_override = override_settings(BASE_DIR=Path(upload_root))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        cache.clear()
+        CachedJWTAuthentication._cache.clear()
+
+        self.user = User.objects.create_user(username="tester", password="s3cure-pass")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+    def upload(self, content=SAMPLE_CSV, name="equipment.csv"):
+        return self.client.post(
+            "/api/upload_with_summary/",
+            {"file": SimpleUploadedFile(name, content, content_type="text/csv")},
+            format="multipart",
+        )
+
+
+class CorsTests(APITestBase):
+
+    def test_listed_origin_is_allowed(self):
+        response = self.client.get("/api/history/", HTTP_ORIGIN="http://localhost:3000")
+        self.assertEqual(response["Access-Control-Allow-Origin"], "http://localhost:3000")
+
+    def test_vercel_preview_origin_is_allowed(self):
+        origin = "https://chemical-equipment-visualizer-git-main.vercel.app"
+        response = self.client.get("/api/history/", HTTP_ORIGIN=origin)
+        self.assertEqual(response["Access-Control-Allow-Origin"], origin)
+
+    def test_unknown_origin_is_rejected(self):
+        response = self.client.get("/api/history/", HTTP_ORIGIN="https://evil.example.com")
+        self.assertNotIn("Access-Control-Allow-Origin", response)
+
+
+class CachedJWTAuthenticationTests(APITestBase):
+
+    def test_valid_token_is_cached_once(self):
+        self.assertEqual(self.client.get("/api/history/").status_code, 200)
+        self.assertEqual(len(CachedJWTAuthentication._cache), 1)
+
+        self.assertEqual(self.client.get("/api/history/").status_code, 200)
+        self.assertEqual(len(CachedJWTAuthentication._cache), 1)
+
+    def test_invalid_token_is_not_cached(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer not-a-token")
+        self.assertEqual(self.client.get("/api/history/").status_code, 401)
+        self.assertEqual(len(CachedJWTAuthentication._cache), 0)
+
+
+class ETagTests(APITestBase):
+
+    def test_history_matching_etag_returns_304(self):
+        etag = self.client.get("/api/history/")["ETag"]
+
+        response = self.client.get("/api/history/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_summary_matching_etag_returns_304(self):
+        self.upload()
+        etag = self.client.get("/api/summary/")["ETag"]
+
+        response = self.client.get("/api/summary/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_weak_etag_matches(self):
+        etag = self.client.get("/api/history/")["ETag"]
+
+        response = self.client.get("/api/history/", HTTP_IF_NONE_MATCH=f"W/{etag}")
+        self.assertEqual(response.status_code, 304)
+
+    def test_stale_etag_returns_body(self):
+        etag = self.client.get("/api/history/")["ETag"]
+        self.upload()
+
+        response = self.client.get("/api/history/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 1)
+
+
+class UploadWithSummaryTests(APITestBase):
+
+    def test_returns_summary_and_history(self):
+        response = self.upload()
+
+        self.assertEqual(response.status_code, 200)
+        summary = response.data["summary"]
+        self.assertEqual(summary["total_rows"], 2)
+        self.assertEqual(summary["averages"]["flowrate"], 90.0)
+        self.assertEqual(summary["equipment_type_counts"], {"Pump": 1, "Valve": 1})
+
+        history = response.data["history"]
+        self.assertEqual(history["count"], 1)
+        self.assertTrue(history["datasets"][0]["file_name"].endswith("equipment.csv"))
+
+    def test_summary_matches_summary_endpoint(self):
+        uploaded = self.upload().data["summary"]
+
+        fetched = self.client.get("/api/summary/").data
+        self.assertEqual(fetched["updated_at"], uploaded["updated_at"])
+        self.assertEqual(fetched["total_rows"], uploaded["total_rows"])
+
+    def test_missing_column_is_rejected(self):
+        response = self.upload(b"Equipment Name,Type\nPump-1,Pump\n")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["error"], "Missing column: Flowrate")
+
+    def test_requires_authentication(self):
+        self.client.credentials()
+        self.assertEqual(self.upload().status_code, 401)
@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import RegisterAPI, UploadCSV, SummaryAPI, HistoryAPI, PDFReportAPIView
+from .views import RegisterAPI, UploadCSV, UploadWithSummaryAPI, SummaryAPI, HistoryAPI, PDFReportAPIView
 
 urlpatterns = [
     # Public endpoint (no auth required)
@@ -7,6 +7,7 @@ urlpatterns = [
     
     # Protected endpoints (JWT auth required)
     path('upload/', UploadCSV.as_view()),
+    path('upload_with_summary/', UploadWithSummaryAPI.as_view()),
     path('summary/', SummaryAPI.as_view()),
     path('history/', HistoryAPI.as_view()),
     path('report/', PDFReportAPIView.as_view()),
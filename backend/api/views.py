@@ -4,13 +4,17 @@ from rest_framework import status
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.gzip import gzip_page
 from django.utils.decorators import method_decorator
 from django.http import HttpResponse
 import pandas as pd
 import os
 import io
+import json
+import hashlib
 from datetime import datetime
 from django.conf import settings
+from django.core.cache import cache
 from .models import Dataset
 from .serializers import UserRegistrationSerializer
 
@@ -28,6 +32,104 @@ matplotlib.use('Agg')  # Use non-GUI backend for server-side rendering
 import matplotlib.pyplot as plt
 
 
+# ==================== SUMMARY HELPERS ====================
+def build_summary(df):
+    """
+    Compute summary statistics for an equipment DataFrame.
+    Output is formatted for easy use with Chart.js.
+    """
+    # Calculate summary statistics
+    total_rows = len(df)
+    avg_flowrate = round(df["Flowrate"].mean(), 2)
+    avg_pressure = round(df["Pressure"].mean(), 2)
+    avg_temperature = round(df["Temperature"].mean(), 2)
+
+    # Count equipment per Type
+    type_counts = df["Type"].value_counts().to_dict()
+
+    # Format response for Chart.js
+    # Chart.js needs "labels" and "data" arrays for charts
+    summary = {
+        # Basic statistics
+        "total_rows": total_rows,
+        "averages": {
+            "flowrate": avg_flowrate,
+            "pressure": avg_pressure,
+            "temperature": avg_temperature
+        },
+
+        # Bar chart data for averages (Chart.js format)
+        "averages_chart": {
+            "labels": ["Flowrate", "Pressure", "Temperature"],
+            "datasets": [{
+                "label": "Average Values",
+                "data": [avg_flowrate, avg_pressure, avg_temperature],
+                "backgroundColor": [
+                    "rgba(54, 162, 235, 0.6)",
+                    "rgba(255, 99, 132, 0.6)",
+                    "rgba(75, 192, 192, 0.6)"
+                ],
+                "borderColor": [
+                    "rgba(54, 162, 235, 1)",
+                    "rgba(255, 99, 132, 1)",
+                    "rgba(75, 192, 192, 1)"
+                ],
+                "borderWidth": 1
+            }]
+        },
+
+        # Pie/Doughnut chart data for equipment types (Chart.js format)
+        "equipment_types_chart": {
+            "labels": list(type_counts.keys()),
+            "datasets": [{
+                "label": "Equipment Count",
+                "data": list(type_counts.values()),
+                "backgroundColor": [
+                    "rgba(255, 99, 132, 0.6)",
+                    "rgba(54, 162, 235, 0.6)",
+                    "rgba(255, 206, 86, 0.6)",
+                    "rgba(75, 192, 192, 0.6)",
+                    "rgba(153, 102, 255, 0.6)",
+                    "rgba(255, 159, 64, 0.6)"
+                ]
+            }]
+        },
+
+        # Raw type counts for reference
+        "equipment_type_counts": type_counts
+    }
+    return summary
+
+
+def build_history(limit=5):
+    """Return the newest `limit` datasets as the /api/history/ payload."""
+    datasets = Dataset.objects.order_by('-uploaded_at')[:limit]
+
+    history = []
+    for dataset in datasets:
+        history.append({
+            "file_name": dataset.file_name,
+            "uploaded_at": dataset.uploaded_at.isoformat()
+        })
+
+    return {
+        "count": len(history),
+        "datasets": history
+    }
+
+
+def etag_matches(request, etag):
+    """
+    Check If-None-Match against `etag` using weak comparison, since
+    gzip_page turns the ETags of compressed responses into W/"..." ones.
+    """
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in tags or "*" in tags
+
+
 # ==================== USER REGISTRATION API ====================
 @method_decorator(csrf_exempt, name='dispatch')
 class RegisterAPI(APIView):
@@ -101,11 +203,15 @@ class UploadCSV(APIView):
         '''
         return HttpResponse(html)
 
-    def post(self, request):
+    def _save_upload(self, request):
+        """
+        Validate and store the uploaded CSV.
+        Returns (DataFrame, Dataset, None) on success or (None, None, error Response).
+        """
         file = request.FILES.get('file')
 
         if not file:
-            return Response(
+            return None, None, Response(
                 {"error": "No file uploaded"},
                 status=status.HTTP_400_BAD_REQUEST
             )
@@ -114,7 +220,7 @@ class UploadCSV(APIView):
         try:
             df = pd.read_csv(file)
         except Exception:
-            return Response(
+            return None, None, Response(
                 {"error": "Invalid CSV file"},
                 status=status.HTTP_400_BAD_REQUEST
             )
@@ -130,7 +236,7 @@ class UploadCSV(APIView):
 
         for col in required_columns:
             if col not in df.columns:
-                return Response(
+                return None, None, Response(
                     {"error": f"Missing column: {col}"},
                     status=status.HTTP_400_BAD_REQUEST
                 )
@@ -146,7 +252,14 @@ class UploadCSV(APIView):
                 destination.write(chunk)
 
         # Save file path to database
-        Dataset.objects.create(file_name=file_path)
+        dataset = Dataset.objects.create(file_name=file_path)
+
+        return df, dataset, None
+
+    def post(self, request):
+        df, dataset, error = self._save_upload(request)
+        if error is not None:
+            return error
 
         return Response(
             {"message": "CSV uploaded successfully"},
@@ -154,14 +267,46 @@ class UploadCSV(APIView):
         )
 
 
+@method_decorator(csrf_exempt, name='dispatch')
+@method_decorator(gzip_page, name='dispatch')
+class UploadWithSummaryAPI(UploadCSV):
+    """
+    POST /api/upload_with_summary/
+    Upload a CSV and return its summary and the updated history in the
+    same response, saving clients round trips to /api/summary/ and
+    /api/history/.
+    Requires authentication.
+    """
+
+    def post(self, request):
+        df, dataset, error = self._save_upload(request)
+        if error is not None:
+            return error
+
+        summary = build_summary(df)
+        summary["updated_at"] = dataset.uploaded_at.isoformat()
+
+        return Response({
+            "message": "CSV uploaded successfully",
+            "summary": summary,
+            "history": build_history()
+        }, status=status.HTTP_200_OK)
+
+
+@method_decorator(gzip_page, name='dispatch')
 class SummaryAPI(APIView):
     """
     GET /api/summary/
     Returns summary statistics from the latest uploaded CSV file.
     Output is formatted for easy use with Chart.js.
+    Responses carry an ETag; a matching If-None-Match gets a 304.
+    Bodies are gzipped for clients that accept it.
+    Pass ?since=<updated_at> to get {"unchanged": true} instead of the
+    full payload when no newer dataset has been uploaded.
     Requires authentication.
     """
     permission_classes = [IsAuthenticated]
+    cache_timeout = 300
 
     def get(self, request):
         # Step 1: Get the latest uploaded dataset from the database
@@ -174,109 +319,72 @@ class SummaryAPI(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # Step 2: Try to read the CSV file
-        try:
-            df = pd.read_csv(dataset.file_name)
-        except FileNotFoundError:
-            return Response(
-                {"error": "CSV file not found on server."},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        except Exception as e:
+        # Client already has the latest dataset: skip the payload entirely
+        updated_at = dataset.uploaded_at.isoformat()
+        if request.query_params.get("since") == updated_at:
             return Response(
-                {"error": f"Error reading CSV file: {str(e)}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                {"unchanged": True, "updated_at": updated_at},
+                status=status.HTTP_200_OK
             )
 
-        # Step 3: Calculate summary statistics
-        total_rows = len(df)
-        avg_flowrate = round(df["Flowrate"].mean(), 2)
-        avg_pressure = round(df["Pressure"].mean(), 2)
-        avg_temperature = round(df["Temperature"].mean(), 2)
+        # Step 2: Serve from cache; a new upload gets a new key
+        cache_key = f"summary:{dataset.pk}"
+        cached = cache.get(cache_key)
 
-        # Step 4: Count equipment per Type
-        type_counts = df["Type"].value_counts().to_dict()
+        if cached is None:
+            # Step 3: Try to read the CSV file
+            try:
+                df = pd.read_csv(dataset.file_name)
+            except FileNotFoundError:
+                return Response(
+                    {"error": "CSV file not found on server."},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            except Exception as e:
+                return Response(
+                    {"error": f"Error reading CSV file: {str(e)}"},
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
 
-        # Step 5: Format response for Chart.js
-        # Chart.js needs "labels" and "data" arrays for charts
-        summary = {
-            # Basic statistics
-            "total_rows": total_rows,
-            "averages": {
-                "flowrate": avg_flowrate,
-                "pressure": avg_pressure,
-                "temperature": avg_temperature
-            },
-
-            # Bar chart data for averages (Chart.js format)
-            "averages_chart": {
-                "labels": ["Flowrate", "Pressure", "Temperature"],
-                "datasets": [{
-                    "label": "Average Values",
-                    "data": [avg_flowrate, avg_pressure, avg_temperature],
-                    "backgroundColor": [
-                        "rgba(54, 162, 235, 0.6)",
-                        "rgba(255, 99, 132, 0.6)",
-                        "rgba(75, 192, 192, 0.6)"
-                    ],
-                    "borderColor": [
-                        "rgba(54, 162, 235, 1)",
-                        "rgba(255, 99, 132, 1)",
-                        "rgba(75, 192, 192, 1)"
-                    ],
-                    "borderWidth": 1
-                }]
-            },
-
-            # Pie/Doughnut chart data for equipment types (Chart.js format)
-            "equipment_types_chart": {
-                "labels": list(type_counts.keys()),
-                "datasets": [{
-                    "label": "Equipment Count",
-                    "data": list(type_counts.values()),
-                    "backgroundColor": [
-                        "rgba(255, 99, 132, 0.6)",
-                        "rgba(54, 162, 235, 0.6)",
-                        "rgba(255, 206, 86, 0.6)",
-                        "rgba(75, 192, 192, 0.6)",
-                        "rgba(153, 102, 255, 0.6)",
-                        "rgba(255, 159, 64, 0.6)"
-                    ]
-                }]
-            },
-
-            # Raw type counts for reference
-            "equipment_type_counts": type_counts
-        }
-
-        return Response(summary, status=status.HTTP_200_OK)
+            # Step 4: Calculate summary statistics and chart data
+            summary = build_summary(df)
+            summary["updated_at"] = updated_at
+            payload = json.dumps(summary, sort_keys=True, default=str).encode()
+            etag = f'"{hashlib.md5(payload).hexdigest()}"'
+            cached = (summary, etag)
+            cache.set(cache_key, cached, self.cache_timeout)
 
+        summary, etag = cached
 
+        # Step 5: Skip the body if the client already has this version
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        return Response(summary, status=status.HTTP_200_OK, headers={"ETag": etag})
+
+
+@method_decorator(gzip_page, name='dispatch')
 class HistoryAPI(APIView):
     """
     GET /api/history/
     Returns the last 5 uploaded CSV datasets.
     Ordered by newest first.
+    Responses carry an ETag; a matching If-None-Match gets a 304.
+    Bodies are gzipped for clients that accept it.
     Requires authentication.
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         # Get the last 5 datasets, ordered by newest first
-        datasets = Dataset.objects.order_by('-uploaded_at')[:5]
+        payload = build_history()
 
-        # Build the response list
-        history = []
-        for dataset in datasets:
-            history.append({
-                "file_name": dataset.file_name,
-                "uploaded_at": dataset.uploaded_at.isoformat()
-            })
+        # Let clients revalidate with If-None-Match instead of re-downloading
+        etag = f'"{hashlib.md5(json.dumps(payload, sort_keys=True).encode()).hexdigest()}"'
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
-        return Response({
-            "count": len(history),
-            "datasets": history
-        }, status=status.HTTP_200_OK)
+        return Response(payload, status=status.HTTP_200_OK, headers={"ETag": etag})
 
     def delete(self, request):
         """Delete all upload history."""
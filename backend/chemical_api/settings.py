@@ -96,6 +96,27 @@ DATABASES = {
     }
 }
 
+# =========================
+# CACHE
+# =========================
+# Redis when REDIS_URL is set (needs the `redis` package), otherwise
+# a per-process in-memory cache.
+REDIS_URL = os.environ.get("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # =========================
 # PASSWORD VALIDATION
 # =========================
@@ -111,7 +132,7 @@ AUTH_PASSWORD_VALIDATORS = [
 # =========================
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'Asia/Kolkata'
-USE_I18N = True
+USE_I18N = False  # API-only backend: no translated templates to render
 USE_TZ = True
 
 # =========================
@@ -121,14 +142,24 @@ STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
+# collectstatic writes .br and .gz copies next to each hashed asset
+# (Brotli via whitenoise[brotli]); only the hashed files are kept and
+# they are served with a one-year cache lifetime.
+WHITENOISE_KEEP_ONLY_HASHED_FILES = True
+WHITENOISE_MAX_AGE = 0 if DEBUG else 31536000
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'uploaded_files'
 
 # =========================
 # CSRF TRUSTED ORIGINS
 # =========================
+# Production web frontend, shared by the CSRF and CORS allow-lists
+FRONTEND_ORIGIN = 'https://chemical-equipment-visualizer-one.vercel.app'
+
+# Django's CsrfViewMiddleware already caches these as a set per process
 CSRF_TRUSTED_ORIGINS = [
-    'https://chemical-equipment-visualizer-one.vercel.app',
+    FRONTEND_ORIGIN,
     'https://chemical-equipment-visualizer-1-majo.onrender.com',
 ]
 
@@ -142,7 +173,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # =========================
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -156,8 +187,12 @@ SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=30),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
     'ROTATE_REFRESH_TOKENS': False,
-    'BLACKLIST_AFTER_ROTATION': True,
+    'BLACKLIST_AFTER_ROTATION': False,  # No rotation and token_blacklist isn't installed
     'AUTH_HEADER_TYPES': ('Bearer',),
+    # HS256 is the cheapest verify simplejwt supports (it has no EdDSA);
+    # pinned explicitly so the algorithm/key can't drift with library defaults.
+    'ALGORITHM': 'HS256',
+    'SIGNING_KEY': SECRET_KEY,
 }
 
 # =========================
@@ -167,7 +202,7 @@ SIMPLE_JWT = {
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
     "http://127.0.0.1:3000",
-    "https://chemical-equipment-visualizer-one.vercel.app",
+    FRONTEND_ORIGIN,
 ]
 
 # Also allow any Vercel preview deployments
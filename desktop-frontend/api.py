@@ -2,29 +2,112 @@
 API Utility Module
 Handles authentication and API requests with token management.
 """
+import base64
+import json
+import os
+import threading
+import time
 import requests
-from typing import Optional, Dict, Any
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Tuple, Callable
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup; stdlib json also accepts bytes
+    _json_loads = json.loads
+
+
+# (connect, read) timeouts: fail fast when the backend is down, but give
+# slow endpoints (uploads, PDF generation) longer to respond
+TIMEOUT = (3.05, 10)
+LONG_TIMEOUT = (3.05, 30)
+
+# Socket write size for request bodies; http.client's 8 KiB default turns a
+# large CSV upload into thousands of tiny encoder reads and send() calls
+_SEND_BLOCKSIZE = 256 * 1024
+
+# Only urllib3 2.x pools accept a blocksize; requests 2.31 still allows 1.26
+_URLLIB3_HAS_BLOCKSIZE = int(urllib3.__version__.split(".")[0]) >= 2
+
+
+def parse_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+    
+    The result is memoized on the response, so a response handed back
+    again (e.g. from the ETag cache) is not decoded twice.
+    """
+    try:
+        return response._parsed_json
+    except AttributeError:
+        data = response._parsed_json = _json_loads(response.content)
+        return data
+
+
+class _BlockSizeAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections send bodies in _SEND_BLOCKSIZE blocks (urllib3 2.x)."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        # On urllib3 1.26 the kwarg breaks every request, so keep the default there
+        if _URLLIB3_HAS_BLOCKSIZE:
+            kwargs["blocksize"] = _SEND_BLOCKSIZE
+        super().init_poolmanager(*args, **kwargs)
 
 
 class APIClient:
     """Singleton API client that manages authentication and requests."""
     
     _instance = None
+    _lock = threading.Lock()
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._init()
+                    cls._instance = instance
         return cls._instance
     
-    def __init__(self):
-        if self._initialized:
-            return
-            
+    def _init(self):
+        """One-time initialization, run under the class lock."""
         self.base_url = "http://127.0.0.1:8000"
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
-        self._initialized = True
+        self._access_exp: float = 0
+
+        # Invariant headers, rebuilt only when the access token changes
+        self._base_headers = {"Content-Type": "application/json"}
+        self._auth_header: Optional[str] = None
+        self._auth_headers: Dict[str, str] = {}
+        self._headers: Dict[str, str] = self._base_headers
+
+        # Last ETag-bearing response per GET endpoint+params, for conditional requests
+        self._etag_cache: Dict[Tuple, Tuple[str, requests.Response]] = {}
+
+        # `updated_at` of the last summary received, for delta polling
+        self._last_summary_ts: Optional[str] = None
+
+        # Persistent session so every call reuses pooled keep-alive connections.
+        # HTTP/1.1 keep-alive is as far as it goes: the backend runs under
+        # gunicorn's sync workers, which don't speak HTTP/2.
+        self._session = requests.Session()
+        adapter = _BlockSizeAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            # No connect retries: an unreachable backend fails after one connect timeout.
+            # Once 5xx retries run out, hand back the last response instead of raising
+            max_retries=Retry(
+                total=2, connect=0, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
     
     @property
     def is_authenticated(self) -> bool:
@@ -34,10 +117,35 @@ class APIClient:
     @property
     def headers(self) -> Dict[str, str]:
         """Get headers with authorization if authenticated."""
-        headers = {"Content-Type": "application/json"}
-        if self._access_token:
-            headers["Authorization"] = f"Bearer {self._access_token}"
-        return headers
+        return self._headers
+
+    def _set_access_token(self, token: Optional[str]):
+        """Store the access token and rebuild the cached auth headers."""
+        self._access_token = token
+        self._access_exp = self._decode_exp(token) if token else 0
+        if token:
+            self._auth_header = "Bearer " + token
+            self._auth_headers = {"Authorization": self._auth_header}
+            self._headers = {**self._base_headers, **self._auth_headers}
+        else:
+            self._auth_header = None
+            self._auth_headers = {}
+            self._headers = self._base_headers
+
+    @staticmethod
+    def _decode_exp(token: Optional[str]) -> float:
+        """Read the `exp` claim from a JWT without verifying it (0 if unreadable)."""
+        try:
+            segment = token.split(".")[1]
+            payload = json.loads(base64.urlsafe_b64decode(segment + "=="))
+            return float(payload["exp"])
+        except Exception:
+            return 0
+
+    def _ensure_fresh_token(self):
+        """Refresh the access token shortly before it expires to avoid a 401 round trip."""
+        if self._access_exp and self._refresh_token and time.time() > self._access_exp - 60:
+            self.refresh_access_token()
     
     def login(self, username: str, password: str) -> Dict[str, Any]:
         """
@@ -51,16 +159,16 @@ class APIClient:
             Dict with success status and message
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/token/",
                 json={"username": username, "password": password},
                 headers={"Content-Type": "application/json"},
-                timeout=10
+                timeout=TIMEOUT
             )
             
             if response.status_code == 200:
                 data = response.json()
-                self._access_token = data.get("access")
+                self._set_access_token(data.get("access"))
                 self._refresh_token = data.get("refresh")
                 return {"success": True, "message": "Login successful"}
             
@@ -99,11 +207,11 @@ class APIClient:
             if email:
                 payload["email"] = email
                 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/register/",
                 json=payload,
                 headers={"Content-Type": "application/json"},
-                timeout=10
+                timeout=TIMEOUT
             )
             
             if response.status_code == 201:
@@ -124,8 +232,10 @@ class APIClient:
     
     def logout(self):
         """Clear stored tokens."""
-        self._access_token = None
+        self._set_access_token(None)
         self._refresh_token = None
+        self._etag_cache.clear()
+        self._last_summary_ts = None
     
     def refresh_access_token(self) -> bool:
         """
@@ -138,26 +248,65 @@ class APIClient:
             return False
             
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/token/refresh/",
                 json={"refresh": self._refresh_token},
                 headers={"Content-Type": "application/json"},
-                timeout=10
+                timeout=TIMEOUT
             )
             
             if response.status_code == 200:
                 data = response.json()
-                self._access_token = data.get("access")
+                self._set_access_token(data.get("access"))
                 return True
             return False
             
         except Exception:
             return False
     
+    def _send(self, method: str, endpoint: str, timeout: Tuple[float, float] = TIMEOUT,
+              retry: bool = True, stream: bool = False, **kwargs) -> requests.Response:
+        """
+        Prepare and send an authenticated request.
+        
+        On 401 the access token is refreshed and the same prepared request
+        is sent again with only its Authorization header patched, so the
+        body is never rebuilt or re-read.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            timeout: (connect, read) timeout in seconds
+            retry: Whether to refresh and retry once on 401
+            stream: Leave the body unread so it can be consumed in chunks
+            **kwargs: Passed to requests.Request (headers, params, json, files, data)
+            
+        Returns:
+            Response object
+        """
+        self._ensure_fresh_token()
+        headers = {**self._auth_headers, **kwargs.pop("headers", {})}
+        request = requests.Request(method, f"{self.base_url}{endpoint}", headers=headers, **kwargs)
+        prepared = self._session.prepare_request(request)
+
+        response = self._session.send(prepared, timeout=timeout, stream=stream)
+        
+        # Try to refresh token on 401
+        if retry and response.status_code == 401 and self._refresh_token:
+            if self.refresh_access_token():
+                response.close()
+                prepared.headers["Authorization"] = self._auth_header
+                response = self._session.send(prepared, timeout=timeout, stream=stream)
+        
+        return response
+
     def get(self, endpoint: str, params: Optional[Dict] = None) -> requests.Response:
         """
         Make authenticated GET request.
         
+        Sends If-None-Match when an earlier response carried an ETag and
+        returns that cached response again on 304 Not Modified.
+        
         Args:
             endpoint: API endpoint (e.g., "/api/summary/")
             params: Optional query parameters
@@ -165,17 +314,53 @@ class APIClient:
         Returns:
             Response object
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = self.headers.copy()
-        headers.pop("Content-Type", None)  # Not needed for GET
+        cache_key = (endpoint, tuple(sorted(params.items())) if params else ())
+        cached = self._etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+
+        response = self._send("GET", endpoint, headers=headers, params=params)
+
+        if response.status_code == 304 and cached:
+            return cached[1]
+        if response.status_code == 200 and response.headers.get("ETag"):
+            self._etag_cache[cache_key] = (response.headers["ETag"], response)
         
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        return response
+    
+    def get_stream(self, endpoint: str, params: Optional[Dict] = None) -> requests.Response:
+        """
+        Make authenticated GET request without reading the body.
         
-        # Try to refresh token on 401
-        if response.status_code == 401 and self._refresh_token:
-            if self.refresh_access_token():
-                headers["Authorization"] = f"Bearer {self._access_token}"
-                response = requests.get(url, headers=headers, params=params, timeout=10)
+        For large downloads: consume it with response.iter_content() and
+        close the response when done. Bypasses the ETag cache.
+        
+        Args:
+            endpoint: API endpoint (e.g., "/api/report/")
+            params: Optional query parameters
+            
+        Returns:
+            Response object with an unread body
+        """
+        return self._send("GET", endpoint, params=params, timeout=LONG_TIMEOUT, stream=True)
+    
+    def get_summary(self) -> requests.Response:
+        """
+        Fetch /api/summary/ as a delta poll.
+        
+        Sends the `updated_at` of the last summary received; the server
+        answers {"unchanged": true} instead of the full payload when no
+        newer dataset exists.
+        
+        Returns:
+            Response object
+        """
+        params = {"since": self._last_summary_ts} if self._last_summary_ts else None
+        response = self.get("/api/summary/", params=params)
+
+        if response.status_code == 200:
+            updated_at = parse_json(response).get("updated_at")
+            if updated_at:
+                self._last_summary_ts = updated_at
         
         return response
     
@@ -192,25 +377,50 @@ class APIClient:
         Returns:
             Response object
         """
-        url = f"{self.base_url}{endpoint}"
-        
         if files:
             # For file uploads, don't set Content-Type (let requests handle it)
-            headers = {}
-            if self._access_token:
-                headers["Authorization"] = f"Bearer {self._access_token}"
-            response = requests.post(url, headers=headers, files=files, timeout=30)
-        else:
-            response = requests.post(url, headers=self.headers, json=data, timeout=10)
+            return self._send("POST", endpoint, files=files, timeout=LONG_TIMEOUT)
+        return self._send("POST", endpoint, json=data)
+
+    def upload_file(self, endpoint: str, file_path: str, field: str = "file",
+                    content_type: str = "text/csv",
+                    progress: Optional[Callable[[int, int], None]] = None) -> requests.Response:
+        """
+        Stream a file upload as multipart/form-data.
+        
+        The body is read from disk in chunks while sending instead of
+        being buffered in memory first.
+        
+        Args:
+            endpoint: API endpoint
+            file_path: Path of the file to upload
+            field: Form field name
+            content_type: MIME type of the file
+            progress: Optional callback(bytes_sent, total_bytes), called
+                from the sending thread as the body is read
+            
+        Returns:
+            Response object
+        """
+        file_name = os.path.basename(file_path)
+
+        def send() -> requests.Response:
+            # A fresh encoder per attempt, since each one consumes its file
+            with open(file_path, "rb") as f:
+                encoder = MultipartEncoder(fields={field: (file_name, f, content_type)})
+                if progress is not None:
+                    encoder = MultipartEncoderMonitor(
+                        encoder, lambda m: progress(m.bytes_read, m.len)
+                    )
+                return self._send("POST", endpoint, timeout=LONG_TIMEOUT, retry=False,
+                                  headers={"Content-Type": encoder.content_type}, data=encoder)
+
+        response = send()
         
         # Try to refresh token on 401
         if response.status_code == 401 and self._refresh_token:
             if self.refresh_access_token():
-                if files:
-                    headers["Authorization"] = f"Bearer {self._access_token}"
-                    response = requests.post(url, headers=headers, files=files, timeout=30)
-                else:
-                    response = requests.post(url, headers=self.headers, json=data, timeout=10)
+                response = send()
         
         return response
 
@@ -224,19 +434,7 @@ class APIClient:
         Returns:
             Response object
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = self.headers.copy()
-        headers.pop("Content-Type", None)  # Not needed for DELETE
-        
-        response = requests.delete(url, headers=headers, timeout=10)
-        
-        # Try to refresh token on 401
-        if response.status_code == 401 and self._refresh_token:
-            if self.refresh_access_token():
-                headers["Authorization"] = f"Bearer {self._access_token}"
-                response = requests.delete(url, headers=headers, timeout=10)
-        
-        return response
+        return self._send("DELETE", endpoint)
 
 
 # Global API client instance
@@ -1,20 +1,74 @@
 import sys
-import requests
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton,
     QFileDialog, QLabel, QMessageBox
 )
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 
-API_BASE_URL = "http://127.0.0.1:8000/api"
+from api import api, parse_json
 
+# How often to re-check the summary; unchanged polls cost an empty body
+SUMMARY_POLL_MS = 30_000
 
-class ChartCanvas(FigureCanvas):
-    def __init__(self):
-        self.fig = Figure(figsize=(5, 4))
-        self.ax = self.fig.add_subplot(111)
-        super().__init__(self.fig)
+
+def create_chart_canvas():
+    """Build the chart canvas, importing matplotlib only on first use."""
+    import matplotlib
+    matplotlib.use("Qt5Agg")  # Skip backend auto-detection
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(5, 4))
+    canvas = FigureCanvas(fig)
+    canvas.fig = fig
+    canvas.ax = fig.add_subplot(111)
+    canvas.bars = None
+    canvas.names = None
+    return canvas
+
+
+class ApiWorker(QObject):
+    """Runs API calls off the GUI thread and reports results via signals."""
+
+    # One signal pair per operation so concurrent calls can't be mistaken for each other
+    summary_ready = pyqtSignal(dict)
+    summary_failed = pyqtSignal(str)
+    upload_done = pyqtSignal(dict)
+    upload_failed = pyqtSignal(str)
+
+    _executor = ThreadPoolExecutor(max_workers=4)
+
+    def fetch_summary(self):
+        self._executor.submit(self._get_summary).add_done_callback(
+            partial(self._emit, self.summary_ready, self.summary_failed)
+        )
+
+    def upload(self, file_path):
+        self._executor.submit(self._upload, file_path).add_done_callback(
+            partial(self._emit, self.upload_done, self.upload_failed)
+        )
+
+    def _get_summary(self):
+        response = api.get_summary()
+        if response.status_code != 200:
+            raise RuntimeError(response.text)
+        return parse_json(response)
+
+    def _upload(self, file_path):
+        # Combined endpoint returns the fresh summary, saving a second round trip
+        response = api.upload_file("/api/upload_with_summary/", file_path)
+        if response.status_code != 200:
+            raise RuntimeError(response.text)
+        return parse_json(response)["summary"]
+
+    @staticmethod
+    def _emit(finished, failed, future):
+        try:
+            finished.emit(future.result())
+        except Exception as e:
+            failed.emit(str(e))
 
 
 class DesktopApp(QWidget):
@@ -32,16 +86,28 @@ class DesktopApp(QWidget):
         self.summary_label = QLabel("Upload a CSV file to view summary")
         self.summary_label.setWordWrap(True)
 
-        self.chart = ChartCanvas()
+        # Created on first draw so matplotlib stays out of startup
+        self.chart = None
 
         self.layout.addWidget(self.upload_btn)
         self.layout.addWidget(self.summary_label)
-        self.layout.addWidget(self.chart)
 
         self.setLayout(self.layout)
 
+        self.worker = ApiWorker()
+        self.worker.summary_ready.connect(self.show_summary)
+        self.worker.summary_failed.connect(self.on_summary_failed)
+        self.worker.upload_done.connect(self.on_upload_done)
+        self.worker.upload_failed.connect(self.on_upload_failed)
+
         self.fetch_summary()
 
+        # Poll through get_summary's since= delta mode to pick up other uploads
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(SUMMARY_POLL_MS)
+        self.poll_timer.timeout.connect(self.fetch_summary)
+        self.poll_timer.start()
+
     def upload_csv(self):
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Select CSV File", "", "CSV Files (*.csv)"
@@ -50,51 +116,69 @@ class DesktopApp(QWidget):
         if not file_path:
             return
 
-        try:
-            with open(file_path, 'rb') as f:
-                response = requests.post(
-                    f"{API_BASE_URL}/upload/",
-                    files={"file": f}
-                )
-
-            if response.status_code == 200:
-                QMessageBox.information(self, "Success", "CSV uploaded successfully")
-                self.fetch_summary()
-            else:
-                QMessageBox.warning(self, "Error", response.text)
-
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+        self.upload_btn.setEnabled(False)
+        self.worker.upload(file_path)
 
     def fetch_summary(self):
-        try:
-            response = requests.get(f"{API_BASE_URL}/summary/")
-            data = response.json()
+        self.worker.fetch_summary()
+
+    def on_upload_done(self, data):
+        self.upload_btn.setEnabled(True)
+        QMessageBox.information(self, "Success", "CSV uploaded successfully")
+        self.show_summary(data)
+
+    def on_upload_failed(self, message):
+        self.upload_btn.setEnabled(True)
+        QMessageBox.warning(self, "Error", message)
+
+    def show_summary(self, data):
+        if data.get("unchanged"):
+            return
 
-            self.summary_label.setText(
-                f"Total Records: {data['total_rows']}\n"
-                f"Avg Flowrate: {data['averages']['flowrate']}\n"
-                f"Avg Pressure: {data['averages']['pressure']}\n"
-                f"Avg Temperature: {data['averages']['temperature']}"
-            )
+        self.summary_label.setText(
+            f"Total Records: {data['total_rows']}\n"
+            f"Avg Flowrate: {data['averages']['flowrate']}\n"
+            f"Avg Pressure: {data['averages']['pressure']}\n"
+            f"Avg Temperature: {data['averages']['temperature']}"
+        )
 
-            self.draw_chart(data["equipment_type_counts"])
+        self.draw_chart(data["equipment_type_counts"])
 
-        except Exception:
+    def on_summary_failed(self, message):
+        # A failed background poll shouldn't wipe a summary that is already shown
+        if self.chart is None:
             self.summary_label.setText("Failed to fetch summary from backend")
 
     def draw_chart(self, counts):
-        self.chart.ax.clear()
+        if self.chart is None:
+            self.chart = create_chart_canvas()
+            self.layout.addWidget(self.chart)
+
         names = list(counts.keys())
         values = list(counts.values())
 
-        self.chart.ax.bar(names, values)
-        self.chart.ax.set_title("Equipment Type Distribution")
-        self.chart.draw()
+        if self.chart.bars is None or names != self.chart.names:
+            # Categories changed: rebuild the bars and tick labels
+            self.chart.ax.clear()
+            self.chart.bars = self.chart.ax.bar(names, values)
+            self.chart.names = names
+            self.chart.ax.set_title("Equipment Type Distribution")
+        else:
+            # Same categories: only move the bar heights
+            for bar, value in zip(self.chart.bars, values):
+                bar.set_height(value)
+            self.chart.ax.relim()
+            self.chart.ax.autoscale_view()
 
+        self.chart.draw_idle()
 
-if __name__ == "__main__":
+
+def main():
     app = QApplication(sys.argv)
     window = DesktopApp()
     window.show()
-    sys.exit(app.exec_())
+    return app.exec_()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Dashboard Charts
+Matplotlib canvas for the dashboard bar chart, kept in its own module so
+matplotlib is only imported when the first chart is drawn.
+"""
+from PyQt5.QtWidgets import QSizePolicy
+
+import matplotlib
+matplotlib.use("Qt5Agg")  # Skip backend auto-detection
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+from matplotlib.colors import to_rgba
+
+
+# Chart styling, parsed to RGBA once instead of on every redraw
+_BAR_COLORS = [to_rgba(c) for c in ('#3b82f6', '#f59e0b', '#10b981')]
+_CHART_BG = to_rgba('#f8fafc')
+_YLABEL_PROPS = {'fontsize': 9, 'color': to_rgba('#64748b')}
+_X_TICK_PROPS = {'labelsize': 9, 'colors': to_rgba('#475569')}
+_Y_TICK_PROPS = {'labelsize': 8, 'colors': to_rgba('#94a3b8')}
+_GRID_PROPS = {'linestyle': '--', 'alpha': 0.3, 'color': to_rgba('#cbd5e1')}
+_BAR_LABELS = ["Flowrate", "Pressure", "Temperature"]
+
+
+class ResponsiveCanvas(FigureCanvas):
+    """Matplotlib canvas that resizes properly with layouts."""
+
+    def __init__(self, parent=None):
+        self.fig = Figure(facecolor='#f8fafc')
+        self.axes = self.fig.add_subplot(111)
+        # Fixed margins instead of tight_layout, whose bbox solver ran on every draw
+        self.fig.subplots_adjust(left=0.12, right=0.98, top=0.92, bottom=0.15)
+        super().__init__(self.fig)
+        self.setParent(parent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(200, 180)
+
+        # Artists kept between redraws so refreshes can mutate them in place
+        self.bars = None
+
+        # Blitting: animated artists are painted over a cached static background
+        self._background = None
+        self._animated = []
+        self.mpl_connect('draw_event', self._on_draw)
+
+    def set_animated_artists(self, artists: list):
+        """Mark the artists that refreshes repaint via blitting."""
+        for artist in artists:
+            artist.set_animated(True)
+        self._animated = list(artists)
+
+    def _on_draw(self, event):
+        """After a full draw, cache the static background and paint the animated artists."""
+        self._background = self.copy_from_bbox(self.fig.bbox)
+        for artist in self._animated:
+            self.fig.draw_artist(artist)
+
+    def blit_animated(self):
+        """Repaint only the animated artists; falls back to a full draw if nothing is cached."""
+        if self._background is None:
+            self.draw_idle()
+            return
+        self.restore_region(self._background)
+        for artist in self._animated:
+            self.fig.draw_artist(artist)
+        self.blit(self.fig.bbox)
+
+    def draw_bars(self, values: list):
+        """Draw the averages bar chart, reusing its bars after the first draw."""
+        if self.bars is None:
+            self.bars = self.axes.bar(_BAR_LABELS, values, color=_BAR_COLORS, width=0.6)
+            self.axes.set_ylabel("Average Value", **_YLABEL_PROPS)
+            self.axes.set_facecolor(_CHART_BG)
+            self.axes.tick_params(axis='x', **_X_TICK_PROPS)
+            self.axes.tick_params(axis='y', **_Y_TICK_PROPS)
+            for spine in self.axes.spines.values():
+                spine.set_visible(False)
+            self.axes.yaxis.grid(True, **_GRID_PROPS)
+            self.set_animated_artists(self.bars.patches)
+            self.draw_idle()
+            return
+
+        for bar, value in zip(self.bars, values):
+            bar.set_height(value)
+        old_ylim = self.axes.get_ylim()
+        self.axes.relim()
+        self.axes.autoscale_view(scalex=False)
+
+        if self.axes.get_ylim() == old_ylim:
+            self.blit_animated()
+        else:
+            # Axis ticks changed, so the cached background is stale
+            self.draw_idle()
@@ -3,21 +3,79 @@ Dashboard Window
 Professional PyQt5 dashboard with colorful cards, View Results, and Clear History.
 """
 import os
+import json
+import math
+import tempfile
+import textwrap
 import requests
-from datetime import datetime
+from datetime import datetime, timezone, timedelta
+from functools import lru_cache, partial
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QFileDialog, QFrame, QTableWidget, QTableWidgetItem,
+    QFileDialog, QFrame, QTableView,
     QHeaderView, QScrollArea, QSizePolicy, QMessageBox,
-    QSpacerItem, QApplication
+    QSpacerItem, QGridLayout
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont, QColor, QPalette
+from PyQt5.QtCore import (
+    Qt, QObject, QAbstractTableModel, QModelIndex, QPointF, QRectF,
+    QRunnable, QSize, QThreadPool, pyqtSignal
+)
+from PyQt5.QtGui import QFont, QColor, QPalette, QPainter, QBrush, QIcon
+
+from api import api, parse_json
+
+
+# Pie chart styling (drawn with QPainter, no matplotlib)
+_PIE_COLORS = ('#8b5cf6', '#3b82f6', '#10b981', '#f59e0b', '#ef4444', '#ec4899')
+_PIE_BG = '#f8fafc'
+_PIE_LABEL_COLOR = '#475569'
+_PIE_START_ANGLE = 90
+
+# SVG icons, rendered once by Qt instead of shaping colour-emoji glyphs
+_ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "icons")
+_BUTTON_ICON_SIZE = QSize(16, 16)
+
+# Read size for streamed downloads
+_DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
+# Mode a plain open() would give saved files. os.umask() can only be read by
+# setting it, so do that once here, before any worker threads create files.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_SAVED_FILE_MODE = 0o666 & ~_UMASK
+
+# Indian Standard Time (UTC+5:30) and the display format for upload times
+_IST = timezone(timedelta(hours=5, minutes=30))
+_IST_FORMAT = "%d %b %Y, %I:%M %p"
+
 
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+@lru_cache(maxsize=None)
+def _font(size: int, weight: int = -1, family: str = "Segoe UI") -> QFont:
+    """Return a shared QFont, built on first use (after QApplication exists)."""
+    return QFont(family, size, weight)
 
-from api import api
+
+@lru_cache(maxsize=None)
+def _icon(name: str) -> QIcon:
+    """Return a shared QIcon for assets/icons/<name>.svg."""
+    return QIcon(os.path.join(_ICON_DIR, f"{name}.svg"))
+
+
+def _section_title(icon: str, text: str) -> QHBoxLayout:
+    """Build a section heading: SVG icon followed by the title label."""
+    row = QHBoxLayout()
+    row.setSpacing(8)
+
+    icon_label = QLabel()
+    icon_label.setPixmap(_icon(icon).pixmap(20, 20))
+    row.addWidget(icon_label)
+
+    title = QLabel(text)
+    title.setObjectName("sectionTitle")
+    title.setFont(_font(12, QFont.Bold))
+    row.addWidget(title)
+    row.addStretch()
+    return row
 
 
 def format_to_ist(iso_string: str) -> str:
@@ -25,41 +83,97 @@ def format_to_ist(iso_string: str) -> str:
     try:
         # Parse ISO format
         dt = datetime.fromisoformat(iso_string.replace('Z', '+00:00'))
-        # Convert to IST (UTC+5:30)
-        from datetime import timezone, timedelta
-        ist = timezone(timedelta(hours=5, minutes=30))
-        dt_ist = dt.astimezone(ist)
-        return dt_ist.strftime("%d %b %Y, %I:%M %p")
+        return dt.astimezone(_IST).strftime(_IST_FORMAT)
     except Exception:
         return iso_string
 
 
-class ResponsiveCanvas(FigureCanvas):
-    """Matplotlib canvas that resizes properly with layouts."""
+def format_all_to_ist(iso_strings: list) -> list:
+    """Convert a batch of ISO timestamps to IST, reusing format_to_ist's rules."""
+    return [format_to_ist(s) if s else "" for s in iso_strings]
+
+
+class PieWidget(QWidget):
+    """Lightweight pie chart painted directly with QPainter."""
 
     def __init__(self, parent=None):
-        self.fig = Figure(facecolor='#f8fafc', tight_layout=True)
-        self.axes = self.fig.add_subplot(111)
-        super().__init__(self.fig)
-        self.setParent(parent)
+        super().__init__(parent)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setMinimumSize(200, 180)
+        self._labels = []
+        self._values = []
+        self._brushes = [QBrush(QColor(c)) for c in _PIE_COLORS]
+        self._bg = QColor(_PIE_BG)
+        self._label_color = QColor(_PIE_LABEL_COLOR)
+        self._pct_color = QColor(Qt.white)
+
+    def set_data(self, labels: list, values: list):
+        """Replace the slices and schedule a repaint."""
+        self._labels = list(labels)
+        self._values = list(values)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), self._bg)
+
+        total = float(sum(self._values))
+        if not total:
+            return
+
+        # Square pie centred in the widget, leaving room for outside labels
+        radius = min(self.width() * 0.6, self.height() * 0.8) / 2
+        cx, cy = self.width() / 2, self.height() / 2
+        pie_rect = QRectF(cx - radius, cy - radius, 2 * radius, 2 * radius)
+
+        painter.setPen(Qt.NoPen)
+        start = _PIE_START_ANGLE
+        for i, value in enumerate(self._values):
+            span = 360.0 * value / total
+            painter.setBrush(self._brushes[i % len(self._brushes)])
+            # QPainter angles are 1/16 degree, counter-clockwise from 3 o'clock
+            painter.drawPie(pie_rect, int(start * 16), int(span * 16))
+            start += span
+
+        # Same placement as the old matplotlib pie: labels at 1.1r, percentages at 0.6r
+        label_font, pct_font = _font(9), _font(8, QFont.Bold)
+        start = _PIE_START_ANGLE
+        for label, value in zip(self._labels, self._values):
+            span = 360.0 * value / total
+            mid = math.radians(start + span / 2)
+            x, y = math.cos(mid), -math.sin(mid)
+            start += span
+
+            label = str(label)
+            painter.setFont(label_font)
+            painter.setPen(self._label_color)
+            metrics = painter.fontMetrics()
+            lx = cx + 1.1 * radius * x
+            if x <= 0:
+                lx -= metrics.horizontalAdvance(label)
+            painter.drawText(QPointF(lx, cy + 1.1 * radius * y + metrics.ascent() / 2), label)
+
+            pct = '%1.0f%%' % (100.0 * value / total)
+            painter.setFont(pct_font)
+            painter.setPen(self._pct_color)
+            metrics = painter.fontMetrics()
+            painter.drawText(
+                QPointF(cx + 0.6 * radius * x - metrics.horizontalAdvance(pct) / 2,
+                        cy + 0.6 * radius * y + metrics.ascent() / 2),
+                pct
+            )
 
 
 class ColorfulSummaryCard(QFrame):
     """Colorful summary card with icon, value, and unit."""
 
-    def __init__(self, icon: str, title: str, value: str, unit: str, 
-                 bg_gradient: tuple, value_color: str):
+    def __init__(self, icon: str, title: str, value: str, unit: str, variant: str):
         super().__init__()
         self.setObjectName("colorfulCard")
+        # Colors come from the dashboard stylesheet's [variant="..."] rules
+        self.setProperty("variant", variant)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        
-        # Store colors for styling
-        self.bg_start, self.bg_end = bg_gradient
-        self.accent_color = value_color
-        
-        self._apply_card_style()
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 18, 20, 18)
@@ -67,67 +181,386 @@ class ColorfulSummaryCard(QFrame):
         layout.setAlignment(Qt.AlignCenter)
 
         # Icon
-        self.icon_label = QLabel(icon)
-        self.icon_label.setFont(QFont("Segoe UI Emoji", 24))
+        self.icon_label = QLabel()
+        self.icon_label.setPixmap(_icon(icon).pixmap(28, 28))
         self.icon_label.setAlignment(Qt.AlignCenter)
-        self.icon_label.setStyleSheet("background: transparent;")
         layout.addWidget(self.icon_label)
 
         # Title
         self.title_label = QLabel(title.upper())
-        self.title_label.setFont(QFont("Segoe UI", 8, QFont.Bold))
+        self.title_label.setObjectName("cardTitle")
+        self.title_label.setFont(_font(8, QFont.Bold))
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet("color: #64748b; background: transparent; letter-spacing: 1px;")
         layout.addWidget(self.title_label)
 
         # Value
         self.value_label = QLabel(value)
-        self.value_label.setFont(QFont("Segoe UI", 26, QFont.Bold))
+        self.value_label.setObjectName("cardValue")
+        self.value_label.setFont(_font(26, QFont.Bold))
         self.value_label.setAlignment(Qt.AlignCenter)
-        self.value_label.setStyleSheet(f"color: {value_color}; background: transparent;")
         layout.addWidget(self.value_label)
 
         # Unit
         self.unit_label = QLabel(unit)
-        self.unit_label.setFont(QFont("Segoe UI", 9, QFont.DemiBold))
+        self.unit_label.setObjectName("cardUnit")
+        self.unit_label.setFont(_font(9, QFont.DemiBold))
         self.unit_label.setAlignment(Qt.AlignCenter)
-        self.unit_label.setStyleSheet("color: #94a3b8; background: transparent;")
         layout.addWidget(self.unit_label)
 
-    def _apply_card_style(self):
-        self.setStyleSheet(f"""
-            #colorfulCard {{
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {self.bg_start}, stop:1 {self.bg_end}
-                );
-                border-radius: 16px;
-                border-top: 4px solid {self.accent_color};
-            }}
-            #colorfulCard:hover {{
-                border-top: 4px solid {self.accent_color};
-            }}
-        """)
-
     def set_value(self, value: str):
         """Update the card value."""
         self.value_label.setText(value)
 
 
+class HistoryTableModel(QAbstractTableModel):
+    """Read-only model over prepared history rows, so no per-cell items are allocated."""
+
+    HEADERS = ("#", "Filename", "Uploaded At")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_rows(self, rows: list):
+        """Replace all rows with (number, file name, uploaded at) tuples."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
+class _TaskSignals(QObject):
+    """Signals for _ApiTask; QRunnable itself cannot define signals."""
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)  # the exception raised by the task
+    progress = pyqtSignal(int)
+
+
+class _ApiTask(QRunnable):
+    """
+    Runs a blocking API call on the global thread pool.
+
+    With report_progress=True, fn also receives a `progress` keyword
+    callback taking (done, total) and emitting whole-percent updates.
+    """
+
+    def __init__(self, fn, *args, report_progress: bool = False):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.report_progress = report_progress
+        self.signals = _TaskSignals()
+        self._last_percent = -1
+
+    def _progress(self, done: int, total: int):
+        # Called per body chunk; only cross threads when the percentage moves
+        percent = int(done * 100 / total) if total else 100
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.signals.progress.emit(percent)
+
+    def run(self):
+        try:
+            if self.report_progress:
+                result = self.fn(*self.args, progress=self._progress)
+            else:
+                result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+
 class DashboardWindow(QWidget):
     """Main dashboard with professional theme."""
 
     logout_requested = pyqtSignal()
 
-    def __init__(self):
+    # Built once at import, dedented so every window shares the same string
+    _QSS = textwrap.dedent("""
+        QWidget {
+            background-color: #f8fafc;
+            color: #1e293b;
+        }
+        QLabel {
+            background: transparent;
+        }
+        #headerFrame {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 #1e3a5f, stop:0.5 #2d5a87, stop:1 #3b82f6
+            );
+        }
+        #headerTitle {
+            color: white;
+        }
+        #headerSubtitle {
+            color: rgba(255, 255, 255, 0.8);
+        }
+        #logoutBtn {
+            background: rgba(255, 255, 255, 0.15);
+            color: white;
+            border: 1px solid rgba(255, 255, 255, 0.3);
+            border-radius: 8px;
+            padding: 10px 20px;
+        }
+        #logoutBtn:hover {
+            background: rgba(255, 255, 255, 0.25);
+            border-color: rgba(255, 255, 255, 0.5);
+        }
+        #contentArea {
+            background-color: #f8fafc;
+        }
+        #section {
+            background-color: white;
+            border-radius: 16px;
+            border: 1px solid #e2e8f0;
+        }
+        #section:hover {
+            border-color: #cbd5e1;
+        }
+        #sectionTitle {
+            color: #1e293b;
+        }
+        #hintLabel {
+            color: #94a3b8;
+        }
+        #uploadStatus[state="pending"] {
+            color: #64748b;
+        }
+        #uploadStatus[state="success"] {
+            color: #10b981;
+        }
+        #uploadStatus[state="error"] {
+            color: #ef4444;
+        }
+        #colorfulCard {
+            border-radius: 16px;
+        }
+        #colorfulCard[variant="purple"] {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:1,
+                stop:0 #f5f3ff, stop:1 #ede9fe
+            );
+            border-top: 4px solid #7c3aed;
+        }
+        #colorfulCard[variant="blue"] {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:1,
+                stop:0 #eff6ff, stop:1 #dbeafe
+            );
+            border-top: 4px solid #2563eb;
+        }
+        #colorfulCard[variant="amber"] {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:1,
+                stop:0 #fffbeb, stop:1 #fef3c7
+            );
+            border-top: 4px solid #d97706;
+        }
+        #colorfulCard[variant="green"] {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:1,
+                stop:0 #ecfdf5, stop:1 #d1fae5
+            );
+            border-top: 4px solid #059669;
+        }
+        #cardTitle {
+            color: #64748b;
+            letter-spacing: 1px;
+        }
+        #colorfulCard[variant="purple"] #cardValue {
+            color: #7c3aed;
+        }
+        #colorfulCard[variant="blue"] #cardValue {
+            color: #2563eb;
+        }
+        #colorfulCard[variant="amber"] #cardValue {
+            color: #d97706;
+        }
+        #colorfulCard[variant="green"] #cardValue {
+            color: #059669;
+        }
+        #cardUnit {
+            color: #94a3b8;
+        }
+        #uploadBtn {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 #6366f1, stop:1 #8b5cf6
+            );
+            color: white;
+            border: none;
+            border-radius: 10px;
+            padding: 12px 24px;
+        }
+        #uploadBtn:hover {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 #4f46e5, stop:1 #7c3aed
+            );
+        }
+        #uploadBtn:disabled {
+            background: #e2e8f0;
+            color: #94a3b8;
+        }
+        #viewBtn {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 #3b82f6, stop:1 #60a5fa
+            );
+            color: white;
+            border: none;
+            border-radius: 10px;
+            padding: 12px 24px;
+        }
+        #viewBtn:hover {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 #2563eb, stop:1 #3b82f6
+            );
+        }
+        #viewBtn:disabled {
+            background: #e2e8f0;
+            color: #94a3b8;
+        }
+        #exportPdfBtn {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 #10b981, stop:1 #34d399
+            );
+            color: white;
+            border: none;
+            border-radius: 10px;
+            padding: 12px 24px;
+        }
+        #exportPdfBtn:hover {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 #059669, stop:1 #10b981
+            );
+        }
+        #exportPdfBtn:disabled {
+            background: #e2e8f0;
+            color: #94a3b8;
+        }
+        #clearHistoryBtn {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 #ef4444, stop:1 #f87171
+            );
+            color: white;
+            border: none;
+            border-radius: 8px;
+            padding: 8px 16px;
+        }
+        #clearHistoryBtn:hover {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 #dc2626, stop:1 #ef4444
+            );
+        }
+        #chartContainer {
+            background-color: #f8fafc;
+            border-radius: 12px;
+            border: 1px solid #e2e8f0;
+        }
+        #chartTitle {
+            color: #475569;
+        }
+        #historyTable {
+            background-color: white;
+            border: 1px solid #e2e8f0;
+            border-radius: 8px;
+            gridline-color: #f1f5f9;
+        }
+        #historyTable::item {
+            padding: 8px;
+            color: #475569;
+        }
+        #historyTable::item:selected {
+            background-color: #eff6ff;
+            color: #1e293b;
+        }
+        QHeaderView::section {
+            background-color: #f8fafc;
+            padding: 10px;
+            border: none;
+            border-bottom: 1px solid #e2e8f0;
+            font-weight: 600;
+            color: #64748b;
+            text-transform: uppercase;
+            font-size: 11px;
+        }
+        #noDataLabel {
+            color: #94a3b8;
+            background: #f8fafc;
+            padding: 30px;
+            border-radius: 8px;
+        }
+        #footerFrame {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 #1e3a5f, stop:1 #2d5a87
+            );
+        }
+        #footerText {
+            color: rgba(255, 255, 255, 0.85);
+        }
+        QScrollArea {
+            border: none;
+            background: transparent;
+        }
+        QScrollBar:vertical {
+            background: #f1f5f9;
+            width: 10px;
+            border-radius: 5px;
+        }
+        QScrollBar::handle:vertical {
+            background: #cbd5e1;
+            border-radius: 5px;
+            min-height: 30px;
+        }
+        QScrollBar::handle:vertical:hover {
+            background: #94a3b8;
+        }
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+            height: 0;
+        }
+    """).strip()
+
+    def __init__(self, autoload: bool = True):
         super().__init__()
         self.summary_data = None
         self.show_results = False  # Toggle for showing results
+        self._charts_dirty = True  # Cards/charts don't reflect summary_data yet
+        self._summary_hash = None
+        self._card_values = None  # Values currently shown on the four cards
         self.history_data = []
+        self._history_hash = None  # Hash of the rows currently in the table
+        self._session_id = 0  # Bumped by reset_session() to drop stale task results
         self._setup_window()
         self._build_ui()
         self._apply_styles()
-        self._load_initial_data()
+        # Prewarmed windows are built before login completes; they load in reset_session()
+        if autoload:
+            self._load_initial_data()
 
     def _setup_window(self):
         """Configure window properties."""
@@ -194,9 +627,9 @@ class DashboardWindow(QWidget):
         layout.setSpacing(16)
 
         # Logo + Title
-        logo = QLabel("🧪")
-        logo.setFont(QFont("Segoe UI Emoji", 24))
-        logo.setStyleSheet("background: transparent;")
+        logo = QLabel()
+        logo.setObjectName("headerLogo")
+        logo.setPixmap(_icon("flask").pixmap(32, 32))
         layout.addWidget(logo)
 
         title_container = QVBoxLayout()
@@ -204,21 +637,22 @@ class DashboardWindow(QWidget):
 
         title = QLabel("Chemical Equipment Visualizer")
         title.setObjectName("headerTitle")
-        title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        title.setFont(_font(16, QFont.Bold))
         title_container.addWidget(title)
 
         subtitle = QLabel("Upload CSV files and visualize equipment data")
         subtitle.setObjectName("headerSubtitle")
-        subtitle.setFont(QFont("Segoe UI", 9))
+        subtitle.setFont(_font(9))
         title_container.addWidget(subtitle)
 
         layout.addLayout(title_container)
         layout.addStretch()
 
         # Logout button
-        self.logout_btn = QPushButton("🚪 Logout")
+        self.logout_btn = QPushButton(_icon("log-out"), "Logout")
+        self.logout_btn.setIconSize(_BUTTON_ICON_SIZE)
         self.logout_btn.setObjectName("logoutBtn")
-        self.logout_btn.setFont(QFont("Segoe UI", 10, QFont.DemiBold))
+        self.logout_btn.setFont(_font(10, QFont.DemiBold))
         self.logout_btn.setCursor(Qt.PointingHandCursor)
         self.logout_btn.clicked.connect(self._handle_logout)
         layout.addWidget(self.logout_btn)
@@ -234,28 +668,27 @@ class DashboardWindow(QWidget):
         layout.setContentsMargins(24, 20, 24, 20)
         layout.setSpacing(16)
 
-        title = QLabel("📤 Upload CSV File")
-        title.setObjectName("sectionTitle")
-        title.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        layout.addWidget(title)
+        layout.addLayout(_section_title("upload-cloud", "Upload CSV File"))
 
         # Buttons row
         btn_row = QHBoxLayout()
         btn_row.setSpacing(12)
 
         # Upload button
-        self.upload_btn = QPushButton("🚀 Upload CSV")
+        self.upload_btn = QPushButton(_icon("send"), "Upload CSV")
+        self.upload_btn.setIconSize(_BUTTON_ICON_SIZE)
         self.upload_btn.setObjectName("uploadBtn")
-        self.upload_btn.setFont(QFont("Segoe UI", 10, QFont.DemiBold))
+        self.upload_btn.setFont(_font(10, QFont.DemiBold))
         self.upload_btn.setCursor(Qt.PointingHandCursor)
         self.upload_btn.setMinimumWidth(140)
         self.upload_btn.clicked.connect(self._upload_csv)
         btn_row.addWidget(self.upload_btn)
 
         # View Results button
-        self.view_btn = QPushButton("👁️ View Results")
+        self.view_btn = QPushButton(_icon("eye"), "View Results")
+        self.view_btn.setIconSize(_BUTTON_ICON_SIZE)
         self.view_btn.setObjectName("viewBtn")
-        self.view_btn.setFont(QFont("Segoe UI", 10, QFont.DemiBold))
+        self.view_btn.setFont(_font(10, QFont.DemiBold))
         self.view_btn.setCursor(Qt.PointingHandCursor)
         self.view_btn.setMinimumWidth(140)
         self.view_btn.clicked.connect(self._toggle_results)
@@ -263,9 +696,10 @@ class DashboardWindow(QWidget):
         btn_row.addWidget(self.view_btn)
 
         # Export PDF button
-        self.export_pdf_btn = QPushButton("📄 Download PDF")
+        self.export_pdf_btn = QPushButton(_icon("file-text"), "Download PDF")
+        self.export_pdf_btn.setIconSize(_BUTTON_ICON_SIZE)
         self.export_pdf_btn.setObjectName("exportPdfBtn")
-        self.export_pdf_btn.setFont(QFont("Segoe UI", 10, QFont.DemiBold))
+        self.export_pdf_btn.setFont(_font(10, QFont.DemiBold))
         self.export_pdf_btn.setCursor(Qt.PointingHandCursor)
         self.export_pdf_btn.setMinimumWidth(140)
         self.export_pdf_btn.clicked.connect(self._download_pdf)
@@ -276,7 +710,8 @@ class DashboardWindow(QWidget):
 
         # Status label
         self.upload_status = QLabel("")
-        self.upload_status.setFont(QFont("Segoe UI", 10))
+        self.upload_status.setObjectName("uploadStatus")
+        self.upload_status.setFont(_font(10))
         self.upload_status.setWordWrap(True)
         btn_row.addWidget(self.upload_status)
 
@@ -285,7 +720,7 @@ class DashboardWindow(QWidget):
         # Hint
         hint = QLabel("ℹ️ Required columns: Equipment Name, Type, Flowrate, Pressure, Temperature")
         hint.setObjectName("hintLabel")
-        hint.setFont(QFont("Segoe UI", 9))
+        hint.setFont(_font(9))
         layout.addWidget(hint)
 
         return section
@@ -299,44 +734,28 @@ class DashboardWindow(QWidget):
         layout.setContentsMargins(24, 20, 24, 20)
         layout.setSpacing(16)
 
-        title = QLabel("📊 Summary Dashboard")
-        title.setObjectName("sectionTitle")
-        title.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        layout.addWidget(title)
-
-        # Colorful cards row
-        cards_row = QHBoxLayout()
-        cards_row.setSpacing(16)
-
-        # Card 1: Total Records - Purple
-        self.card_total = ColorfulSummaryCard(
-            icon="📋", title="Total Records", value="—", unit="",
-            bg_gradient=("#f5f3ff", "#ede9fe"), value_color="#7c3aed"
-        )
-        cards_row.addWidget(self.card_total)
-
-        # Card 2: Avg Flowrate - Blue
-        self.card_flowrate = ColorfulSummaryCard(
-            icon="💧", title="Avg Flowrate", value="—", unit="m³/h",
-            bg_gradient=("#eff6ff", "#dbeafe"), value_color="#2563eb"
-        )
-        cards_row.addWidget(self.card_flowrate)
-
-        # Card 3: Avg Pressure - Amber
-        self.card_pressure = ColorfulSummaryCard(
-            icon="⚡", title="Avg Pressure", value="—", unit="bar",
-            bg_gradient=("#fffbeb", "#fef3c7"), value_color="#d97706"
-        )
-        cards_row.addWidget(self.card_pressure)
-
-        # Card 4: Avg Temperature - Green
-        self.card_temperature = ColorfulSummaryCard(
-            icon="🌡️", title="Avg Temperature", value="—", unit="°C",
-            bg_gradient=("#ecfdf5", "#d1fae5"), value_color="#059669"
-        )
-        cards_row.addWidget(self.card_temperature)
+        layout.addLayout(_section_title("bar-chart", "Summary Dashboard"))
+
+        # Build all cards first, then attach them in one grid so the section
+        # lays out once instead of after every card
+        section.setUpdatesEnabled(False)
+        cards = [
+            ColorfulSummaryCard(icon=icon, title=title, value="—", unit=unit, variant=variant)
+            for icon, title, unit, variant in (
+                ("clipboard", "Total Records", "", "purple"),
+                ("droplet", "Avg Flowrate", "m³/h", "blue"),
+                ("zap", "Avg Pressure", "bar", "amber"),
+                ("thermometer", "Avg Temperature", "°C", "green"),
+            )
+        ]
+        self.card_total, self.card_flowrate, self.card_pressure, self.card_temperature = cards
 
-        layout.addLayout(cards_row)
+        cards_grid = QGridLayout()
+        cards_grid.setSpacing(16)
+        for column, card in enumerate(cards):
+            cards_grid.addWidget(card, 0, column)
+        layout.addLayout(cards_grid)
+        section.setUpdatesEnabled(True)
 
         return section
 
@@ -350,10 +769,7 @@ class DashboardWindow(QWidget):
         layout.setContentsMargins(24, 20, 24, 20)
         layout.setSpacing(16)
 
-        title = QLabel("📈 Data Visualization")
-        title.setObjectName("sectionTitle")
-        title.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        layout.addWidget(title)
+        layout.addLayout(_section_title("trending-up", "Data Visualization"))
 
         charts_row = QHBoxLayout()
         charts_row.setSpacing(20)
@@ -368,12 +784,13 @@ class DashboardWindow(QWidget):
 
         bar_title = QLabel("Average Values Comparison")
         bar_title.setAlignment(Qt.AlignCenter)
-        bar_title.setFont(QFont("Segoe UI", 10, QFont.DemiBold))
-        bar_title.setStyleSheet("color: #475569; background: transparent;")
+        bar_title.setObjectName("chartTitle")
+        bar_title.setFont(_font(10, QFont.DemiBold))
         bar_layout.addWidget(bar_title)
 
-        self.bar_chart = ResponsiveCanvas(self)
-        bar_layout.addWidget(self.bar_chart, stretch=1)
+        # Canvas is created on first draw so matplotlib stays out of startup
+        self.bar_chart = None
+        self._bar_layout = bar_layout
 
         charts_row.addWidget(bar_container)
 
@@ -387,11 +804,11 @@ class DashboardWindow(QWidget):
 
         pie_title = QLabel("Equipment Type Distribution")
         pie_title.setAlignment(Qt.AlignCenter)
-        pie_title.setFont(QFont("Segoe UI", 10, QFont.DemiBold))
-        pie_title.setStyleSheet("color: #475569; background: transparent;")
+        pie_title.setObjectName("chartTitle")
+        pie_title.setFont(_font(10, QFont.DemiBold))
         pie_layout.addWidget(pie_title)
 
-        self.pie_chart = ResponsiveCanvas(self)
+        self.pie_chart = PieWidget(self)
         pie_layout.addWidget(self.pie_chart, stretch=1)
 
         charts_row.addWidget(pie_container)
@@ -412,17 +829,13 @@ class DashboardWindow(QWidget):
         # Header row with title and clear button
         header_row = QHBoxLayout()
 
-        title = QLabel("📁 Upload History")
-        title.setObjectName("sectionTitle")
-        title.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        header_row.addWidget(title)
-
-        header_row.addStretch()
+        header_row.addLayout(_section_title("folder", "Upload History"))
 
         # Clear History button
-        self.clear_history_btn = QPushButton("🗑️ Clear History")
+        self.clear_history_btn = QPushButton(_icon("trash"), "Clear History")
+        self.clear_history_btn.setIconSize(_BUTTON_ICON_SIZE)
         self.clear_history_btn.setObjectName("clearHistoryBtn")
-        self.clear_history_btn.setFont(QFont("Segoe UI", 9, QFont.DemiBold))
+        self.clear_history_btn.setFont(_font(9, QFont.DemiBold))
         self.clear_history_btn.setCursor(Qt.PointingHandCursor)
         self.clear_history_btn.clicked.connect(self._clear_history)
         self.clear_history_btn.setVisible(False)
@@ -431,17 +844,17 @@ class DashboardWindow(QWidget):
         layout.addLayout(header_row)
 
         # Table
-        self.history_table = QTableWidget()
+        self._history_model = HistoryTableModel(self)
+        self.history_table = QTableView()
         self.history_table.setObjectName("historyTable")
-        self.history_table.setColumnCount(3)
-        self.history_table.setHorizontalHeaderLabels(["#", "Filename", "Uploaded At"])
+        self.history_table.setModel(self._history_model)
         self.history_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Fixed)
         self.history_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.history_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
         self.history_table.setColumnWidth(0, 50)
         self.history_table.setAlternatingRowColors(True)
-        self.history_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.history_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.history_table.setSelectionBehavior(QTableView.SelectRows)
+        self.history_table.setEditTriggers(QTableView.NoEditTriggers)
         self.history_table.verticalHeader().setVisible(False)
         self.history_table.setMinimumHeight(120)
         self.history_table.setMaximumHeight(200)
@@ -451,7 +864,7 @@ class DashboardWindow(QWidget):
         # No data message
         self.no_history_label = QLabel("No uploads yet. Upload a CSV file to get started.")
         self.no_history_label.setObjectName("noDataLabel")
-        self.no_history_label.setFont(QFont("Segoe UI", 10))
+        self.no_history_label.setFont(_font(10))
         self.no_history_label.setAlignment(Qt.AlignCenter)
         self.no_history_label.setVisible(False)
         layout.addWidget(self.no_history_label)
@@ -468,233 +881,127 @@ class DashboardWindow(QWidget):
         layout.setContentsMargins(24, 0, 24, 0)
 
         text = QLabel("Chemical Equipment Visualizer © 2026")
-        text.setFont(QFont("Segoe UI", 9))
+        text.setObjectName("footerText")
+        text.setFont(_font(9))
         text.setAlignment(Qt.AlignCenter)
-        text.setStyleSheet("color: rgba(255, 255, 255, 0.85); background: transparent;")
         layout.addWidget(text)
 
         return footer
 
     def _apply_styles(self):
         """Apply professional stylesheet."""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f8fafc;
-                color: #1e293b;
-            }
-            #headerFrame {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #1e3a5f, stop:0.5 #2d5a87, stop:1 #3b82f6
-                );
-            }
-            #headerTitle {
-                color: white;
-                background: transparent;
-            }
-            #headerSubtitle {
-                color: rgba(255, 255, 255, 0.8);
-                background: transparent;
-            }
-            #logoutBtn {
-                background: rgba(255, 255, 255, 0.15);
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 0.3);
-                border-radius: 8px;
-                padding: 10px 20px;
-            }
-            #logoutBtn:hover {
-                background: rgba(255, 255, 255, 0.25);
-                border-color: rgba(255, 255, 255, 0.5);
-            }
-            #contentArea {
-                background-color: #f8fafc;
-            }
-            #section {
-                background-color: white;
-                border-radius: 16px;
-                border: 1px solid #e2e8f0;
-            }
-            #section:hover {
-                border-color: #cbd5e1;
-            }
-            #sectionTitle {
-                color: #1e293b;
-                background: transparent;
-            }
-            #hintLabel {
-                color: #94a3b8;
-                background: transparent;
-            }
-            #uploadBtn {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #6366f1, stop:1 #8b5cf6
-                );
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 12px 24px;
-            }
-            #uploadBtn:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #4f46e5, stop:1 #7c3aed
-                );
-            }
-            #uploadBtn:disabled {
-                background: #e2e8f0;
-                color: #94a3b8;
-            }
-            #viewBtn {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #3b82f6, stop:1 #60a5fa
-                );
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 12px 24px;
-            }
-            #viewBtn:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #2563eb, stop:1 #3b82f6
-                );
-            }
-            #viewBtn:disabled {
-                background: #e2e8f0;
-                color: #94a3b8;
-            }
-            #exportPdfBtn {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #10b981, stop:1 #34d399
-                );
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 12px 24px;
-            }
-            #exportPdfBtn:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #059669, stop:1 #10b981
-                );
-            }
-            #exportPdfBtn:disabled {
-                background: #e2e8f0;
-                color: #94a3b8;
-            }
-            #clearHistoryBtn {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #ef4444, stop:1 #f87171
-                );
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 16px;
-            }
-            #clearHistoryBtn:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #dc2626, stop:1 #ef4444
-                );
-            }
-            #chartContainer {
-                background-color: #f8fafc;
-                border-radius: 12px;
-                border: 1px solid #e2e8f0;
-            }
-            #historyTable {
-                background-color: white;
-                border: 1px solid #e2e8f0;
-                border-radius: 8px;
-                gridline-color: #f1f5f9;
-            }
-            #historyTable::item {
-                padding: 8px;
-                color: #475569;
-            }
-            #historyTable::item:selected {
-                background-color: #eff6ff;
-                color: #1e293b;
-            }
-            QHeaderView::section {
-                background-color: #f8fafc;
-                padding: 10px;
-                border: none;
-                border-bottom: 1px solid #e2e8f0;
-                font-weight: 600;
-                color: #64748b;
-                text-transform: uppercase;
-                font-size: 11px;
-            }
-            #noDataLabel {
-                color: #94a3b8;
-                background: #f8fafc;
-                padding: 30px;
-                border-radius: 8px;
-            }
-            #footerFrame {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #1e3a5f, stop:1 #2d5a87
-                );
-            }
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #f1f5f9;
-                width: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background: #cbd5e1;
-                border-radius: 5px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #94a3b8;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0;
-            }
-        """)
+        self.setStyleSheet(self._QSS)
 
     def _load_initial_data(self):
         """Load only history on initial load (don't show results yet)."""
+        # Both requests run concurrently on the thread pool
         self._fetch_summary_silent()
         self._fetch_history()
 
+    def reset_session(self):
+        """Drop the previous user's data and reload, so the window can be reused."""
+        # Results of tasks started before this point are ignored when they land
+        self._session_id += 1
+
+        self.summary_data = None
+        self._summary_hash = None
+        self._card_values = None
+        self._charts_dirty = True
+
+        self._hide_results()
+        self.export_pdf_btn.setText("Download PDF")
+        self.export_pdf_btn.setEnabled(False)
+        self.upload_btn.setEnabled(True)
+        self._reset_clear_btn()
+        self._set_upload_status("", "pending")
+
+        self.history_data = []
+        self._history_hash = None
+        self._update_history(self.history_data)
+
+        self._load_initial_data()
+
+    def _run_task(self, fn, *args, on_done, on_error=None, on_progress=None):
+        """Run fn(*args) off the GUI thread and deliver the result to on_done."""
+        task = _ApiTask(fn, *args, report_progress=on_progress is not None)
+        session_id = self._session_id
+        # partial over a bound method keeps delivery queued onto this window's thread
+        task.signals.finished.connect(partial(self._deliver, session_id, on_done))
+        if on_error is not None:
+            task.signals.failed.connect(partial(self._deliver, session_id, on_error))
+        if on_progress is not None:
+            task.signals.progress.connect(partial(self._deliver, session_id, on_progress))
+        QThreadPool.globalInstance().start(task)
+
+    def _deliver(self, session_id: int, slot, value):
+        """Pass a task result to slot unless reset_session() ran since the task started."""
+        if self._session_id == session_id:
+            slot(value)
+
+    @staticmethod
+    def _get_json(endpoint: str) -> tuple:
+        """
+        GET an endpoint on a worker thread.
+
+        APIClient revalidates with If-None-Match, and parse_json memoizes the
+        decoded body, so an unchanged resource is not decoded again.
+
+        Returns (status_code, payload); payload is None unless the status is 200.
+        """
+        response = api.get(endpoint)
+        if response.status_code != 200:
+            return response.status_code, None
+        return 200, parse_json(response)
+
     def _fetch_summary_silent(self):
         """Fetch summary from API without showing results."""
-        try:
-            response = api.get("/api/summary/")
-            if response.status_code == 200:
-                self.summary_data = response.json()
-                self.view_btn.setEnabled(True)
-                self.export_pdf_btn.setEnabled(True)
-            elif response.status_code == 401:
-                self._handle_auth_error()
-        except Exception:
-            pass
+        self._run_task(self._get_json, "/api/summary/", on_done=self._on_summary_fetched)
+
+    def _on_summary_fetched(self, result: tuple):
+        """Apply a fetched summary on the GUI thread."""
+        status_code, payload = result
+        if status_code == 200:
+            self._apply_summary(payload)
+        elif status_code == 401:
+            self._handle_auth_error()
+
+    def _apply_summary(self, data: dict):
+        """Store new summary data and enable the actions that need it."""
+        # Identical payloads (e.g. re-uploading the same file) keep the current charts
+        summary_hash = hash(json.dumps(
+            {k: v for k, v in data.items() if k != "updated_at"}, sort_keys=True
+        ))
+        if summary_hash != self._summary_hash:
+            self._summary_hash = summary_hash
+            self._charts_dirty = True
+
+        self.summary_data = data
+        self.view_btn.setEnabled(True)
+        self.export_pdf_btn.setEnabled(True)
+
+        if self.show_results:
+            self._render_results()
+
+    def _render_results(self):
+        """Redraw cards and charts, but only if the summary changed since the last draw."""
+        if not self._charts_dirty:
+            return
+        self._update_cards(self.summary_data)
+        self._draw_charts(self.summary_data)
+        self._charts_dirty = False
 
     def _fetch_history(self):
         """Fetch history from API."""
-        try:
-            response = api.get("/api/history/")
-            if response.status_code == 200:
-                data = response.json()
-                self.history_data = data.get("datasets", [])
-                self._update_history(self.history_data)
-            elif response.status_code == 401:
-                self._handle_auth_error()
-        except Exception:
-            pass
+        self._run_task(self._get_json, "/api/history/", on_done=self._on_history_fetched)
+
+    def _on_history_fetched(self, result: tuple):
+        """Apply fetched history on the GUI thread."""
+        status_code, payload = result
+        if status_code == 200:
+            self.history_data = payload.get("datasets", [])
+            self._update_history(self.history_data)
+        elif status_code == 401:
+            self._handle_auth_error()
 
     def _toggle_results(self):
         """Toggle visibility of summary and charts sections."""
@@ -704,29 +1011,57 @@ class DashboardWindow(QWidget):
         self.show_results = not self.show_results
         
         if self.show_results:
-            self._update_cards(self.summary_data)
-            self._draw_charts(self.summary_data)
+            self._render_results()
             self.summary_section.setVisible(True)
             self.charts_section.setVisible(True)
-            self.view_btn.setText("🙈 Hide Results")
+            self.view_btn.setIcon(_icon("eye-off"))
+            self.view_btn.setText("Hide Results")
         else:
             self.summary_section.setVisible(False)
             self.charts_section.setVisible(False)
-            self.view_btn.setText("👁️ View Results")
+            self.view_btn.setIcon(_icon("eye"))
+            self.view_btn.setText("View Results")
+
+    def _hide_results(self):
+        """Hide the summary and charts and disable View Results until new data arrives."""
+        self.show_results = False
+        self.summary_section.setVisible(False)
+        self.charts_section.setVisible(False)
+        self.view_btn.setIcon(_icon("eye"))
+        self.view_btn.setText("View Results")
+        self.view_btn.setEnabled(False)
 
     def _update_cards(self, data: dict):
         """Update summary cards with data."""
-        self.card_total.set_value(str(data.get("total_rows", "—")))
-
         averages = data.get("averages", {})
-        self.card_flowrate.set_value(str(averages.get("flowrate", "—")))
-        self.card_pressure.set_value(str(averages.get("pressure", "—")))
-        self.card_temperature.set_value(str(averages.get("temperature", "—")))
+        values = (
+            str(data.get("total_rows", "—")),
+            str(averages.get("flowrate", "—")),
+            str(averages.get("pressure", "—")),
+            str(averages.get("temperature", "—")),
+        )
+        # Only the type counts changed: skip four setText() relayouts
+        if values == self._card_values:
+            return
+        self._card_values = values
+
+        self.card_total.set_value(values[0])
+        self.card_flowrate.set_value(values[1])
+        self.card_pressure.set_value(values[2])
+        self.card_temperature.set_value(values[3])
 
     def _update_history(self, data: list):
         """Update history table."""
+        # Same rows as already shown (e.g. a no-op refresh): leave the table alone
+        history_hash = hash(tuple(
+            (item.get("file_name", ""), item.get("uploaded_at", "")) for item in data
+        ))
+        if history_hash == self._history_hash:
+            return
+        self._history_hash = history_hash
+
         if not data:
-            self.history_table.setRowCount(0)
+            self._history_model.set_rows([])
             self.history_table.setVisible(False)
             self.no_history_label.setVisible(True)
             self.clear_history_btn.setVisible(False)
@@ -736,61 +1071,58 @@ class DashboardWindow(QWidget):
         self.no_history_label.setVisible(False)
         self.clear_history_btn.setVisible(True)
 
-        self.history_table.setRowCount(len(data))
+        # Prepare plain row tuples and swap them into the model in one reset
+        basename = os.path.basename
+        times = format_all_to_ist([item.get("uploaded_at", "") for item in data])
+        rows = []
         for row, item in enumerate(data):
-            self.history_table.setItem(row, 0, QTableWidgetItem(str(row + 1)))
             file_name = item.get("file_name", "")
             if "/" in file_name or "\\" in file_name:
-                file_name = os.path.basename(file_name)
-            self.history_table.setItem(row, 1, QTableWidgetItem(file_name))
-            # Format time to IST
-            uploaded_at = format_to_ist(item.get("uploaded_at", ""))
-            self.history_table.setItem(row, 2, QTableWidgetItem(uploaded_at))
+                file_name = basename(file_name)
+            rows.append((str(row + 1), file_name, times[row]))
+        self._history_model.set_rows(rows)
+
+    def _ensure_charts(self):
+        """Create the bar chart canvas, importing matplotlib on first use."""
+        if self.bar_chart is not None:
+            return
+        from charts import ResponsiveCanvas
+
+        self.bar_chart = ResponsiveCanvas(self)
+        self._bar_layout.addWidget(self.bar_chart, stretch=1)
 
     def _draw_charts(self, data: dict):
         """Draw bar and pie charts."""
-        # Bar chart for averages
-        averages = data.get("averages", {})
-        if averages:
-            labels = ["Flowrate", "Pressure", "Temperature"]
-            values = [
-                averages.get("flowrate", 0),
-                averages.get("pressure", 0),
-                averages.get("temperature", 0)
-            ]
-            colors = ['#3b82f6', '#f59e0b', '#10b981']
-
-            self.bar_chart.axes.clear()
-            bars = self.bar_chart.axes.bar(labels, values, color=colors, width=0.6)
-            self.bar_chart.axes.set_ylabel("Average Value", fontsize=9, color='#64748b')
-            self.bar_chart.axes.set_facecolor('#f8fafc')
-            self.bar_chart.axes.tick_params(axis='x', labelsize=9, colors='#475569')
-            self.bar_chart.axes.tick_params(axis='y', labelsize=8, colors='#94a3b8')
-            for spine in self.bar_chart.axes.spines.values():
-                spine.set_visible(False)
-            self.bar_chart.axes.yaxis.grid(True, linestyle='--', alpha=0.3, color='#cbd5e1')
-            self.bar_chart.fig.tight_layout()
-            self.bar_chart.draw()
-
-        # Pie chart for equipment types
-        type_counts = data.get("equipment_type_counts", {})
-        if type_counts:
-            labels = list(type_counts.keys())
-            values = list(type_counts.values())
-            colors = ['#8b5cf6', '#3b82f6', '#10b981', '#f59e0b', '#ef4444', '#ec4899']
-
-            self.pie_chart.axes.clear()
-            wedges, texts, autotexts = self.pie_chart.axes.pie(
-                values, labels=labels, colors=colors[:len(labels)],
-                autopct='%1.0f%%', startangle=90, textprops={'fontsize': 9, 'color': '#475569'}
-            )
-            for autotext in autotexts:
-                autotext.set_fontsize(8)
-                autotext.set_color('white')
-                autotext.set_fontweight('bold')
-            self.pie_chart.axes.set_facecolor('#f8fafc')
-            self.pie_chart.fig.tight_layout()
-            self.pie_chart.draw()
+        self._ensure_charts()
+        self.setUpdatesEnabled(False)
+        try:
+            self._draw_bar_chart(data.get("averages", {}))
+            self._draw_pie_chart(data.get("equipment_type_counts", {}))
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _draw_bar_chart(self, averages: dict):
+        """Draw the averages bar chart."""
+        if not averages:
+            return
+        self.bar_chart.draw_bars([
+            averages.get("flowrate", 0),
+            averages.get("pressure", 0),
+            averages.get("temperature", 0)
+        ])
+
+    def _draw_pie_chart(self, type_counts: dict):
+        """Draw the equipment type pie chart."""
+        if not type_counts:
+            return
+        self.pie_chart.set_data(list(type_counts.keys()), list(type_counts.values()))
+
+    def _set_upload_status(self, text: str, state: str):
+        """Show an upload status message styled by its state (pending/success/error)."""
+        self.upload_status.setText(text)
+        self.upload_status.setProperty("state", state)
+        self.upload_status.style().unpolish(self.upload_status)
+        self.upload_status.style().polish(self.upload_status)
 
     def _upload_csv(self):
         """Handle CSV upload."""
@@ -801,33 +1133,49 @@ class DashboardWindow(QWidget):
             return
 
         self.upload_btn.setEnabled(False)
-        self.upload_status.setText("⏳ Uploading...")
-        self.upload_status.setStyleSheet("color: #64748b;")
-        QApplication.processEvents()
+        self._set_upload_status("⏳ Uploading...", "pending")
+        self._run_task(self._post_upload, file_path,
+                       on_done=self._on_upload_done, on_error=self._on_upload_failed,
+                       on_progress=self._on_upload_progress)
+
+    @staticmethod
+    def _post_upload(file_path: str, progress=None) -> tuple:
+        """Upload a CSV (runs on a worker thread). Returns (status_code, body)."""
+        # Streamed from disk; response carries the new summary and history
+        response = api.upload_file("/api/upload_with_summary/", file_path, progress=progress)
+        if response.status_code in [200, 201]:
+            return response.status_code, parse_json(response)
+        return response.status_code, None
+
+    def _on_upload_progress(self, percent: int):
+        """Show upload progress while the body is being sent."""
+        if percent < 100:
+            self._set_upload_status(f"⏳ Uploading... {percent}%", "pending")
+        else:
+            self._set_upload_status("⏳ Processing...", "pending")
+
+    def _on_upload_done(self, result: tuple):
+        """Apply the upload response on the GUI thread."""
+        status_code, data = result
+        self.upload_btn.setEnabled(True)
+
+        if data is not None:
+            self._set_upload_status("✅ Upload successful!", "success")
+            self._apply_summary(data["summary"])
+            self.history_data = data["history"].get("datasets", [])
+            self._update_history(self.history_data)
+            # Auto-show results after upload
+            if self.summary_data and not self.show_results:
+                self._toggle_results()
+        elif status_code == 401:
+            self._handle_auth_error()
+        else:
+            self._set_upload_status(f"❌ Failed: {status_code}", "error")
 
-        try:
-            with open(file_path, "rb") as f:
-                files = {"file": (os.path.basename(file_path), f, "text/csv")}
-                response = api.post("/api/upload/", files=files)
-
-            if response.status_code in [200, 201]:
-                self.upload_status.setText("✅ Upload successful!")
-                self.upload_status.setStyleSheet("color: #10b981;")
-                self._fetch_summary_silent()
-                self._fetch_history()
-                # Auto-show results after upload
-                if self.summary_data and not self.show_results:
-                    self._toggle_results()
-            elif response.status_code == 401:
-                self._handle_auth_error()
-            else:
-                self.upload_status.setText(f"❌ Failed: {response.status_code}")
-                self.upload_status.setStyleSheet("color: #ef4444;")
-        except Exception as e:
-            self.upload_status.setText(f"❌ Error: {str(e)}")
-            self.upload_status.setStyleSheet("color: #ef4444;")
-        finally:
-            self.upload_btn.setEnabled(True)
+    def _on_upload_failed(self, error: Exception):
+        """Report an upload that raised before getting a response."""
+        self.upload_btn.setEnabled(True)
+        self._set_upload_status(f"❌ Error: {error}", "error")
 
     def _download_pdf(self):
         """Download PDF report from the API."""
@@ -846,61 +1194,105 @@ class DashboardWindow(QWidget):
             return
 
         self.export_pdf_btn.setEnabled(False)
-        self.export_pdf_btn.setText("⏳ Generating...")
-        QApplication.processEvents()
-
+        self.export_pdf_btn.setText("Generating...")
+        self._run_task(self._save_report, save_path,
+                       on_done=self._on_report_done, on_error=self._on_report_failed)
+
+    @staticmethod
+    def _save_report(save_path: str) -> tuple:
+        """
+        Download the PDF report to save_path (runs on a worker thread).
+
+        Returns (status_code, error_message, save_path); error_message is
+        set when the server answered 200 with something other than a PDF.
+        """
+        response = api.get_stream("/api/report/")
         try:
-            response = api.get("/api/report/")
-
-            if response.status_code == 200:
-                content_type = response.headers.get('Content-Type', '')
-                if 'application/pdf' in content_type:
-                    with open(save_path, "wb") as f:
-                        f.write(response.content)
-                    QMessageBox.information(
-                        self, "Success",
-                        f"PDF report saved to:\n{save_path}"
-                    )
-                else:
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get('error', 'Unknown error')
-                    except Exception:
-                        error_msg = 'Server returned invalid response'
-                    QMessageBox.warning(
-                        self, "Failed",
-                        f"Failed to generate PDF:\n{error_msg}"
-                    )
-            elif response.status_code == 401:
-                self._handle_auth_error()
-            elif response.status_code == 404:
-                QMessageBox.warning(
-                    self, "No Data",
-                    "No data found. Please upload a CSV file first."
+            if response.status_code != 200:
+                return response.status_code, None, save_path
+
+            content_type = response.headers.get('Content-Type', '')
+            if 'application/pdf' not in content_type:
+                try:
+                    error_data = parse_json(response)
+                    error_msg = error_data.get('error', 'Unknown error')
+                except Exception:
+                    error_msg = 'Server returned invalid response'
+                return response.status_code, error_msg, save_path
+
+            # Write chunks as they arrive instead of buffering the whole PDF.
+            # Stream into a temp file beside the target and move it into place
+            # only once complete, so a failed download never leaves a truncated PDF.
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=".report-", suffix=".part", dir=os.path.dirname(save_path) or "."
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                # mkstemp creates the file 0600; give it the mode open() would have
+                os.chmod(tmp_path, _SAVED_FILE_MODE)
+                os.replace(tmp_path, save_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            return response.status_code, None, save_path
+        finally:
+            response.close()
+
+    def _reset_export_btn(self):
+        """Restore the PDF button after a download finishes."""
+        self.export_pdf_btn.setEnabled(True)
+        self.export_pdf_btn.setText("Download PDF")
+
+    def _on_report_done(self, result: tuple):
+        """Report the outcome of a PDF download on the GUI thread."""
+        status_code, error_msg, save_path = result
+        self._reset_export_btn()
+
+        if status_code == 200:
+            if error_msg is None:
+                QMessageBox.information(
+                    self, "Success",
+                    f"PDF report saved to:\n{save_path}"
                 )
             else:
                 QMessageBox.warning(
                     self, "Failed",
-                    f"Failed to generate PDF: {response.status_code}"
+                    f"Failed to generate PDF:\n{error_msg}"
                 )
-        except requests.exceptions.ConnectionError:
+        elif status_code == 401:
+            self._handle_auth_error()
+        elif status_code == 404:
+            QMessageBox.warning(
+                self, "No Data",
+                "No data found. Please upload a CSV file first."
+            )
+        else:
+            QMessageBox.warning(
+                self, "Failed",
+                f"Failed to generate PDF: {status_code}"
+            )
+
+    def _on_report_failed(self, error: Exception):
+        """Report a PDF download that raised before completing."""
+        self._reset_export_btn()
+
+        if isinstance(error, requests.exceptions.ConnectionError):
             QMessageBox.critical(
                 self, "Connection Error",
                 "Cannot connect to server.\nPlease ensure the backend is running."
             )
-        except requests.exceptions.Timeout:
+        elif isinstance(error, requests.exceptions.Timeout):
             QMessageBox.critical(
                 self, "Timeout",
                 "Request timed out.\nPlease try again."
             )
-        except Exception as e:
+        else:
             QMessageBox.critical(
                 self, "Error",
-                f"Error downloading PDF:\n{str(e)}"
+                f"Error downloading PDF:\n{str(error)}"
             )
-        finally:
-            self.export_pdf_btn.setEnabled(True)
-            self.export_pdf_btn.setText("📄 Download PDF")
 
     def _clear_history(self):
         """Clear all upload history."""
@@ -914,39 +1306,47 @@ class DashboardWindow(QWidget):
             return
 
         self.clear_history_btn.setEnabled(False)
-        self.clear_history_btn.setText("⏳ Clearing...")
-        QApplication.processEvents()
-
-        try:
-            response = api.delete("/api/history/")
-
-            if response.status_code == 200:
-                self.history_data = []
-                self._update_history([])
-                self.summary_data = None
-                self.show_results = False
-                self.summary_section.setVisible(False)
-                self.charts_section.setVisible(False)
-                self.view_btn.setText("👁️ View Results")
-                self.view_btn.setEnabled(False)
-                self.export_pdf_btn.setEnabled(False)
-                self.upload_status.setText("✅ History cleared!")
-                self.upload_status.setStyleSheet("color: #10b981;")
-            elif response.status_code == 401:
-                self._handle_auth_error()
-            else:
-                QMessageBox.warning(
-                    self, "Failed",
-                    f"Failed to clear history: {response.status_code}"
-                )
-        except Exception as e:
-            QMessageBox.critical(
-                self, "Error",
-                f"Error clearing history:\n{str(e)}"
+        self.clear_history_btn.setText("Clearing...")
+        self._run_task(self._delete_history,
+                       on_done=self._on_history_cleared, on_error=self._on_clear_failed)
+
+    @staticmethod
+    def _delete_history() -> int:
+        """Clear the history on the server (runs on a worker thread)."""
+        return api.delete("/api/history/").status_code
+
+    def _reset_clear_btn(self):
+        """Restore the Clear History button after a request finishes."""
+        self.clear_history_btn.setEnabled(True)
+        self.clear_history_btn.setText("Clear History")
+
+    def _on_history_cleared(self, status_code: int):
+        """Reset the dashboard once the server has cleared the history."""
+        self._reset_clear_btn()
+
+        if status_code == 200:
+            self.history_data = []
+            self._update_history([])
+            self.summary_data = None
+            self._summary_hash = None
+            self._hide_results()
+            self.export_pdf_btn.setEnabled(False)
+            self._set_upload_status("✅ History cleared!", "success")
+        elif status_code == 401:
+            self._handle_auth_error()
+        else:
+            QMessageBox.warning(
+                self, "Failed",
+                f"Failed to clear history: {status_code}"
             )
-        finally:
-            self.clear_history_btn.setEnabled(True)
-            self.clear_history_btn.setText("🗑️ Clear History")
+
+    def _on_clear_failed(self, error: Exception):
+        """Report a clear-history request that raised."""
+        self._reset_clear_btn()
+        QMessageBox.critical(
+            self, "Error",
+            f"Error clearing history:\n{str(error)}"
+        )
 
     def _handle_logout(self):
         """Handle logout."""
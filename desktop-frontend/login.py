@@ -3,28 +3,68 @@ Login Window
 PyQt5 login dialog with responsive layout for Windows high-DPI screens.
 Supports both Sign In and Sign Up modes.
 """
+import os
 import sys
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel,
+    QWidget, QVBoxLayout, QFormLayout, QLabel,
     QLineEdit, QPushButton, QFrame, QSpacerItem, QSizePolicy, QApplication
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QPalette, QColor
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot, QTimer
+from PyQt5.QtGui import QColor, QPalette
 
-from api import api
+from api import api as default_api
+
+
+_QSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "login.qss")
+
+# Read once at import; main.py installs it on the QApplication
+with open(_QSS_PATH, encoding="utf-8") as f:
+    LOGIN_QSS = f.read()
+
+# Message label text colours, swapped in as palettes rather than via QSS
+_MESSAGE_COLORS = {"error": "#e53935", "success": "#059669"}
+
+
+class _AuthSignals(QObject):
+    """Signals for _AuthTask; QRunnable itself cannot define signals."""
+
+    done = pyqtSignal(bool, dict)  # (signup, result)
+
+
+class _AuthTask(QRunnable):
+    """Runs api.login/api.register on the global thread pool."""
+
+    def __init__(self, signup: bool, fn, *args):
+        super().__init__()
+        self.signup = signup
+        self.fn = fn
+        self.args = args
+        self.signals = _AuthSignals()
+
+    def run(self):
+        # login/register report failures in the result dict, never by raising
+        self.signals.done.emit(self.signup, self.fn(*self.args))
 
 
 class LoginWindow(QWidget):
     """Responsive login window with centered card layout and signup support."""
 
     login_successful = pyqtSignal()
+    login_started = pyqtSignal()  # a sign-in request was just sent
 
-    def __init__(self):
+    def __init__(self, api=None):
         super().__init__()
+        # Injectable so the standalone preview can run against a mock
+        self.api = api if api is not None else default_api
         self.is_signup_mode = False
         self._setup_window()
         self._build_ui()
-        self._apply_styles()
+
+        # Switches back to Sign In after a successful signup; reused every time
+        self._mode_switch_timer = QTimer(self)
+        self._mode_switch_timer.setSingleShot(True)
+        self._mode_switch_timer.setInterval(2000)
+        self._mode_switch_timer.timeout.connect(self._toggle_mode)
 
     def _setup_window(self):
         """Configure window properties."""
@@ -38,13 +78,6 @@ class LoginWindow(QWidget):
         root = QVBoxLayout(self)
         root.setContentsMargins(20, 20, 20, 20)
 
-        # Top spacer for vertical centering
-        root.addSpacerItem(QSpacerItem(1, 1, QSizePolicy.Minimum, QSizePolicy.Expanding))
-
-        # Horizontal layout for centering card
-        center_h = QHBoxLayout()
-        center_h.addSpacerItem(QSpacerItem(1, 1, QSizePolicy.Expanding, QSizePolicy.Minimum))
-
         # Card frame
         self.card = QFrame()
         self.card.setObjectName("loginCard")
@@ -56,8 +89,8 @@ class LoginWindow(QWidget):
 
         # Logo
         self.logo = QLabel("🧪")
+        self.logo.setObjectName("logoLabel")
         self.logo.setAlignment(Qt.AlignCenter)
-        self.logo.setFont(QFont("Segoe UI Emoji", 36))
         card_layout.addWidget(self.logo)
 
         card_layout.addSpacing(8)
@@ -66,7 +99,6 @@ class LoginWindow(QWidget):
         self.title = QLabel("Chemical Equipment\nVisualizer")
         self.title.setAlignment(Qt.AlignCenter)
         self.title.setObjectName("titleLabel")
-        self.title.setFont(QFont("Segoe UI", 16, QFont.Bold))
         card_layout.addWidget(self.title)
 
         card_layout.addSpacing(24)
@@ -80,12 +112,10 @@ class LoginWindow(QWidget):
 
         # Username
         self.username_label = QLabel("Username")
-        self.username_label.setFont(QFont("Segoe UI", 10, QFont.DemiBold))
         self.username_label.setObjectName("fieldLabel")
 
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Enter your username")
-        self.username_input.setFont(QFont("Segoe UI", 11))
         self.username_input.setObjectName("inputField")
         self.username_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
@@ -97,13 +127,11 @@ class LoginWindow(QWidget):
 
         # Password
         self.password_label = QLabel("Password")
-        self.password_label.setFont(QFont("Segoe UI", 10, QFont.DemiBold))
         self.password_label.setObjectName("fieldLabel")
 
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText("Enter your password")
         self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setFont(QFont("Segoe UI", 11))
         self.password_input.setObjectName("inputField")
         self.password_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
@@ -115,14 +143,12 @@ class LoginWindow(QWidget):
 
         # Confirm Password (signup only)
         self.confirm_password_label = QLabel("Confirm Password")
-        self.confirm_password_label.setFont(QFont("Segoe UI", 10, QFont.DemiBold))
         self.confirm_password_label.setObjectName("fieldLabel")
         self.confirm_password_label.setVisible(False)
 
         self.confirm_password_input = QLineEdit()
         self.confirm_password_input.setPlaceholderText("Confirm your password")
         self.confirm_password_input.setEchoMode(QLineEdit.Password)
-        self.confirm_password_input.setFont(QFont("Segoe UI", 11))
         self.confirm_password_input.setObjectName("inputField")
         self.confirm_password_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.confirm_password_input.setVisible(False)
@@ -136,13 +162,11 @@ class LoginWindow(QWidget):
 
         # Email (signup only, optional)
         self.email_label = QLabel("Email (optional)")
-        self.email_label.setFont(QFont("Segoe UI", 10, QFont.DemiBold))
         self.email_label.setObjectName("fieldLabel")
         self.email_label.setVisible(False)
 
         self.email_input = QLineEdit()
         self.email_input.setPlaceholderText("Enter your email")
-        self.email_input.setFont(QFont("Segoe UI", 11))
         self.email_input.setObjectName("inputField")
         self.email_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.email_input.setVisible(False)
@@ -157,7 +181,6 @@ class LoginWindow(QWidget):
         # Login/Signup button
         self.login_btn = QPushButton("Sign In")
         self.login_btn.setObjectName("loginBtn")
-        self.login_btn.setFont(QFont("Segoe UI", 11, QFont.Bold))
         self.login_btn.setCursor(Qt.PointingHandCursor)
         self.login_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.login_btn.clicked.connect(self._handle_submit)
@@ -168,7 +191,6 @@ class LoginWindow(QWidget):
         # Toggle mode button
         self.toggle_btn = QPushButton("Don't have an account? Sign Up")
         self.toggle_btn.setObjectName("toggleBtn")
-        self.toggle_btn.setFont(QFont("Segoe UI", 9))
         self.toggle_btn.setCursor(Qt.PointingHandCursor)
         self.toggle_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.toggle_btn.clicked.connect(self._toggle_mode)
@@ -178,28 +200,36 @@ class LoginWindow(QWidget):
 
         # Message label (for errors and success)
         self.message_label = QLabel("")
-        self.message_label.setObjectName("errorLabel")
+        self.message_label.setObjectName("messageLabel")
         self.message_label.setAlignment(Qt.AlignCenter)
         self.message_label.setWordWrap(True)
-        self.message_label.setFont(QFont("Segoe UI", 9))
         self.message_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
         card_layout.addWidget(self.message_label)
 
-        # Add card to horizontal center layout
-        center_h.addWidget(self.card)
-        center_h.addSpacerItem(QSpacerItem(1, 1, QSizePolicy.Expanding, QSizePolicy.Minimum))
+        # One palette per message kind, built once and reused on every message
+        self._message_palettes = {}
+        for kind, color in _MESSAGE_COLORS.items():
+            palette = QPalette(self.message_label.palette())
+            palette.setColor(QPalette.WindowText, QColor(color))
+            self._message_palettes[kind] = palette
 
-        root.addLayout(center_h)
+        # Center the card both ways; the root layout hands it its size hint
+        root.addWidget(self.card, 0, Qt.AlignCenter)
 
-        # Bottom spacer for vertical centering
-        root.addSpacerItem(QSpacerItem(1, 1, QSizePolicy.Minimum, QSizePolicy.Expanding))
+        # Widgets only shown in signup mode, toggled together
+        self._signup_widgets = (
+            self.confirm_password_label, self.confirm_password_input,
+            self.email_label, self.email_input,
+        )
 
         # Keyboard navigation
-        self.username_input.returnPressed.connect(lambda: self.password_input.setFocus())
+        # setFocus is a C++ slot, so these connections never enter Python
+        self.username_input.returnPressed.connect(self.password_input.setFocus)
         self.password_input.returnPressed.connect(self._on_password_enter)
-        self.confirm_password_input.returnPressed.connect(lambda: self.email_input.setFocus())
+        self.confirm_password_input.returnPressed.connect(self.email_input.setFocus)
         self.email_input.returnPressed.connect(self._handle_submit)
 
+    @pyqtSlot()
     def _on_password_enter(self):
         """Handle Enter key on password field."""
         if self.is_signup_mode:
@@ -207,17 +237,21 @@ class LoginWindow(QWidget):
         else:
             self._handle_submit()
 
+    @pyqtSlot()
     def _toggle_mode(self):
         """Toggle between login and signup modes."""
+        # A manual toggle cancels a pending auto-switch
+        self._mode_switch_timer.stop()
         self.is_signup_mode = not self.is_signup_mode
+
+        # Repaint the card once after all the changes below
+        self.card.setUpdatesEnabled(False)
         self._clear_form()
-        
+
         # Update visibility
-        self.confirm_password_label.setVisible(self.is_signup_mode)
-        self.confirm_password_input.setVisible(self.is_signup_mode)
-        self.email_label.setVisible(self.is_signup_mode)
-        self.email_input.setVisible(self.is_signup_mode)
-        
+        for widget in self._signup_widgets:
+            widget.setVisible(self.is_signup_mode)
+
         # Update button texts
         if self.is_signup_mode:
             self.login_btn.setText("Sign Up")
@@ -228,6 +262,15 @@ class LoginWindow(QWidget):
             self.toggle_btn.setText("Don't have an account? Sign Up")
             self.password_input.setPlaceholderText("Enter your password")
 
+        self.card.setUpdatesEnabled(True)
+
+    def reset(self):
+        """Return to an empty Sign In form, e.g. before re-showing after logout."""
+        if self.is_signup_mode:
+            self._toggle_mode()  # also clears the form
+        else:
+            self._clear_form()
+
     def _clear_form(self):
         """Clear all input fields."""
         self.username_input.clear()
@@ -235,158 +278,85 @@ class LoginWindow(QWidget):
         self.confirm_password_input.clear()
         self.email_input.clear()
         self.message_label.clear()
-        self.message_label.setObjectName("errorLabel")
-        self._apply_styles()
-
-    def _apply_styles(self):
-        """Apply stylesheet."""
-        self.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #e0f7fa, stop:0.5 #f3e5f5, stop:1 #e8f5e9
-                );
-            }
-            #loginCard {
-                background-color: rgba(255, 255, 255, 0.97);
-                border-radius: 14px;
-                border: 1px solid rgba(0, 0, 0, 0.06);
-                min-width: 280px;
-                max-width: 340px;
-            }
-            #titleLabel {
-                color: #5c6bc0;
-            }
-            #fieldLabel {
-                color: #555;
-                padding-bottom: 2px;
-            }
-            #inputField {
-                padding: 10px 12px;
-                border: 2px solid #e0e0e0;
-                border-radius: 6px;
-                background-color: #fafafa;
-                color: #333;
-                min-height: 18px;
-            }
-            #inputField:focus {
-                border-color: #7c4dff;
-                background-color: #fff;
-            }
-            #loginBtn {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #7c4dff, stop:1 #448aff
-                );
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 12px 20px;
-                min-height: 20px;
-            }
-            #loginBtn:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #651fff, stop:1 #2979ff
-                );
-            }
-            #loginBtn:pressed {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #6200ea, stop:1 #2962ff
-                );
-            }
-            #loginBtn:disabled {
-                background: #bdbdbd;
-            }
-            #toggleBtn {
-                background: transparent;
-                border: none;
-                color: #6366f1;
-                padding: 8px;
-            }
-            #toggleBtn:hover {
-                color: #4f46e5;
-                text-decoration: underline;
-            }
-            #errorLabel {
-                color: #e53935;
-                min-height: 16px;
-            }
-            #successLabel {
-                color: #059669;
-                min-height: 16px;
-            }
-        """)
 
-    def _handle_submit(self):
-        """Process login or signup request."""
-        username = self.username_input.text().strip()
-        password = self.password_input.text()
+    @staticmethod
+    def _validate(username: str, password: str, confirm_password: str, signup: bool):
+        """
+        Check the form values without touching any widgets.
 
+        Returns:
+            None if valid, else (field, message) where field names the
+            input to focus: "username", "password" or "confirm_password"
+        """
         if not username:
-            self._show_error("Please enter your username")
-            self.username_input.setFocus()
-            return
-
-        if len(username) < 3 and self.is_signup_mode:
-            self._show_error("Username must be at least 3 characters")
-            self.username_input.setFocus()
-            return
-
+            return "username", "Please enter your username"
+        if signup and len(username) < 3:
+            return "username", "Username must be at least 3 characters"
         if not password:
-            self._show_error("Please enter your password")
-            self.password_input.setFocus()
-            return
-
-        if self.is_signup_mode:
-            # Signup validation
+            return "password", "Please enter your password"
+        if signup:
             if len(password) < 8:
-                self._show_error("Password must be at least 8 characters")
-                self.password_input.setFocus()
-                return
-
-            confirm_password = self.confirm_password_input.text()
+                return "password", "Password must be at least 8 characters"
             if not confirm_password:
-                self._show_error("Please confirm your password")
-                self.confirm_password_input.setFocus()
-                return
-
+                return "confirm_password", "Please confirm your password"
             if password != confirm_password:
-                self._show_error("Passwords do not match")
-                self.confirm_password_input.setFocus()
-                return
+                return "confirm_password", "Passwords do not match"
+        return None
 
-            email = self.email_input.text().strip()
+    @pyqtSlot()
+    def _handle_submit(self):
+        """Process login or signup request."""
+        # Read each field once; signup-only fields are skipped when signing in
+        signup = self.is_signup_mode
+        username = self.username_input.text().strip()
+        password = self.password_input.text()
+        confirm_password = self.confirm_password_input.text() if signup else ""
 
-            self.login_btn.setEnabled(False)
+        error = self._validate(username, password, confirm_password, signup)
+        if error is not None:
+            field, message = error
+            self._show_error(message)
+            getattr(self, f"{field}_input").setFocus()
+            return
+
+        if signup:
+            email = self.email_input.text().strip()
             self.login_btn.setText("Creating account...")
-            self.message_label.clear()
-            QApplication.processEvents()
+            self._start_auth(True, self.api.register, username, password, confirm_password, email)
+        else:
+            self.login_btn.setText("Signing in...")
+            self._start_auth(False, self.api.login, username, password)
+            self.login_started.emit()
+
+    def _start_auth(self, signup: bool, fn, *args):
+        """Run an auth call off the GUI thread; the result lands in _on_auth_result."""
+        # Mode can't flip while a request is in flight, not even by a pending auto-switch
+        self._mode_switch_timer.stop()
+        self.login_btn.setEnabled(False)
+        self.toggle_btn.setEnabled(False)
+        self.message_label.clear()
 
-            result = api.register(username, password, confirm_password, email)
+        task = _AuthTask(signup, fn, *args)
+        task.signals.done.connect(self._on_auth_result)
+        QThreadPool.globalInstance().start(task)
 
-            self.login_btn.setEnabled(True)
-            self.login_btn.setText("Sign Up")
+    @pyqtSlot(bool, dict)
+    def _on_auth_result(self, signup: bool, result: dict):
+        """Handle a finished login or signup request on the GUI thread."""
+        self.login_btn.setEnabled(True)
+        self.toggle_btn.setEnabled(True)
 
+        # Route by the request that was sent, not by whatever mode is showing now
+        if signup:
+            self.login_btn.setText("Sign Up")
             if result["success"]:
                 self._show_success(result["message"])
                 # Auto switch to login after 2 seconds
-                QTimer.singleShot(2000, self._toggle_mode)
+                self._mode_switch_timer.start()
             else:
                 self._show_error(result["message"])
         else:
-            # Login
-            self.login_btn.setEnabled(False)
-            self.login_btn.setText("Signing in...")
-            self.message_label.clear()
-            QApplication.processEvents()
-
-            result = api.login(username, password)
-
-            self.login_btn.setEnabled(True)
             self.login_btn.setText("Sign In")
-
             if result["success"]:
                 self.login_successful.emit()
             else:
@@ -396,16 +366,18 @@ class LoginWindow(QWidget):
                     error_msg += " Don't have an account? Sign up first!"
                 self._show_error(error_msg)
 
+    def _set_message_kind(self, kind: str):
+        """Colour the message label by swapping in a prebuilt palette."""
+        self.message_label.setPalette(self._message_palettes[kind])
+
     def _show_error(self, msg: str):
         """Display error message."""
-        self.message_label.setObjectName("errorLabel")
-        self._apply_styles()
+        self._set_message_kind("error")
         self.message_label.setText(msg)
 
     def _show_success(self, msg: str):
         """Display success message."""
-        self.message_label.setObjectName("successLabel")
-        self._apply_styles()
+        self._set_message_kind("success")
         self.message_label.setText(msg)
 
 
@@ -419,6 +391,7 @@ if __name__ == "__main__":
 
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    app.setStyleSheet(LOGIN_QSS)
 
     # Mock api for testing
     class MockAPI:
@@ -426,10 +399,7 @@ if __name__ == "__main__":
             return {"success": False, "message": "Test mode - no backend"}
         def register(self, u, p, cp, e=""):
             return {"success": True, "message": "Test registration successful!"}
-    
-    import login
-    login.api = MockAPI()
 
-    window = LoginWindow()
+    window = LoginWindow(api=MockAPI())
     window.show()
     sys.exit(app.exec_())
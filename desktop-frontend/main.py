@@ -2,19 +2,25 @@
 Chemical Equipment Visualizer - Desktop Application
 Entry point with authentication flow.
 """
+import os
 import sys
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 
-from login import LoginWindow
-from dashboard import DashboardWindow
+from login import LoginWindow, LOGIN_QSS
 
 
 # Enable high DPI scaling BEFORE creating QApplication
+os.environ.setdefault("QT_ENABLE_HIGHDPI_SCALING", "1")
 if hasattr(Qt, 'AA_EnableHighDpiScaling'):
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
 if hasattr(Qt, 'AA_UseHighDpiPixmaps'):
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+# Qt 5.14+: use the monitor's exact fractional scale instead of rounding it
+if hasattr(Qt, 'HighDpiScaleFactorRoundingPolicy'):
+    QApplication.setHighDpiScaleFactorRoundingPolicy(
+        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+    )
 
 
 class Application:
@@ -23,34 +29,45 @@ class Application:
     def __init__(self):
         self.app = QApplication(sys.argv)
         self.app.setStyle("Fusion")
+        # Parsed once for the whole process; windows don't set their own copy
+        self.app.setStyleSheet(LOGIN_QSS)
         
-        self.login_window = None
+        # Both windows are built once and shown/hidden across logins
+        self.login_window = LoginWindow()
+        self.login_window.login_successful.connect(self.on_login_success)
+        self.login_window.login_started.connect(self.on_login_started)
         self.dashboard_window = None
     
     def show_login(self):
         """Show the login window."""
-        # Close dashboard if open
+        # Hide dashboard if open; it is kept for the next login
         if self.dashboard_window:
-            self.dashboard_window.close()
-            self.dashboard_window = None
-        
-        # Create and show login window
-        self.login_window = LoginWindow()
-        self.login_window.login_successful.connect(self.on_login_success)
+            self.dashboard_window.hide()
+
+        self.login_window.reset()
         self.login_window.show()
-    
+
+    def on_login_started(self):
+        """Build the dashboard while the sign-in request is still in flight."""
+        QTimer.singleShot(0, self._prewarm_dashboard)
+
+    def _prewarm_dashboard(self):
+        """Create the (hidden, not yet loaded) dashboard if it doesn't exist."""
+        if self.dashboard_window is None:
+            # Imported here so the login window can paint before dashboard loads
+            from dashboard import DashboardWindow
+            self.dashboard_window = DashboardWindow(autoload=False)
+            self.dashboard_window.logout_requested.connect(self.on_logout)
+
     def on_login_success(self):
         """Handle successful login."""
-        # Close login window
-        if self.login_window:
-            self.login_window.close()
-            self.login_window = None
-        
-        # Create and show dashboard
-        self.dashboard_window = DashboardWindow()
-        self.dashboard_window.logout_requested.connect(self.on_logout)
+        self.login_window.hide()
+
+        # Usually already built by on_login_started; (re)load for this user
+        self._prewarm_dashboard()
+        self.dashboard_window.reset_session()
         self.dashboard_window.show()
-    
+
     def on_logout(self):
         """Handle logout request."""
         self.show_login()